@@ -9,16 +9,21 @@
 # - 2024-11-25 08:20 PM EDT
 # - 2025-01-04 03:00 PM EDT
 # - 2025-01-18 02:40 PM EDT
+# - 2026-10-17 10:00 AM EDT
 
 import logging
 import re
-from datetime import date, datetime
-from os import mkdir
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from os import makedirs
 from os.path import exists, expanduser, getmtime
 
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from pytz import timezone
 from tqdm import tqdm
 
@@ -26,10 +31,343 @@ from ncaa_stats_py.utls import (
     _format_folder_str,
     _get_schools,
     _get_seconds_from_time_str,
+    _get_lxml_root,
     _get_stat_id,
     _get_webpage,
 )
 
+# Game times on stats.ncaa.org are listed in Eastern time.
+_EASTERN_TZ = timezone("US/Eastern")
+
+# Characters that are stripped out of every cell in a player's game log.
+_STRIP_TABLE = str.maketrans("", "", "*/\\")
+
+# Columns returned by `get_field_hockey_game_player_stats()`,
+# in the order they are returned in.
+_GAME_PLAYER_STAT_COLUMNS = [
+    "season",
+    "game_id",
+    "sport_id",
+    "team_id",
+    "player_id",
+    "player_jersey_number",
+    "player_full_name",
+    "player_positions",
+    "player_GP",
+    "player_MP",
+    "player_seconds_played",
+    "player_G",
+    "player_SH",
+    "player_AST",
+    "player_SOG",
+    "player_Fouls",
+    "player_YC",
+    "player_GC",
+    "player_RC",
+    "player_PTS",
+    "goalie_GP",
+    "goalie_minutes_played",
+    "goalie_seconds_played",
+    "goalie_GA",
+    "goalie_SV",
+    "goalie_GAA",
+]
+_GAME_PLAYER_STAT_COLUMNS_SET = frozenset(_GAME_PLAYER_STAT_COLUMNS)
+
+# Columns returned by `get_field_hockey_game_team_stats()`,
+# and their types.
+# Cached team game stats are read back in with these types,
+# so a cached file returns the same `DataFrame` as a fresh download.
+_GAME_TEAM_STAT_DTYPES = {
+    "season": "int64",
+    "game_id": "int64",
+    "team_id": "int64",
+    "player_seconds_played": "int64",
+    "player_G": "uint16",
+    "player_SH": "uint16",
+    "player_AST": "uint16",
+    "player_SOG": "uint16",
+    "player_Fouls": "uint16",
+    "player_YC": "uint16",
+    "player_GC": "uint16",
+    "player_RC": "uint16",
+    "player_PTS": "uint16",
+    "goalie_GP": "uint16",
+    "goalie_seconds_played": "float64",
+    "goalie_GA": "uint16",
+    "goalie_SV": "uint16",
+}
+
+# Maps the column names in a game's non-goalkeeper box score tables
+# to the column names used by this package.
+_PLAYERS_RENAME = {
+    "#": "player_jersey_number",
+    "Player": "player_full_name",
+    "Name": "player_full_name",
+    "Yr": "player_class",
+    "Pos": "player_positions",
+    "P": "player_positions",
+    "G": "player_GP",
+    "MP": "player_MP",
+    "GP": "player_GP",
+    "GS": "player_GS",
+    "Goals": "player_G",
+    "SoG": "player_SOG",
+    "AST": "player_AST",
+    "PTS": "player_PTS",
+    "ShAtt": "player_SH",
+    "Fouls": "player_Fouls",
+    "RC": "player_RC",
+    "YC": "player_YC",
+    "GC": "player_GC",
+    "DSv": "player_DSV",
+}
+
+# Maps the column names in a game's goalkeeper box score tables
+# to the column names used by this package.
+_GK_RENAME = {
+    "#": "player_jersey_number",
+    "Player": "player_full_name",
+    "Name": "player_full_name",
+    "Yr": "player_class",
+    "Pos": "player_positions",
+    "P": "player_positions",
+    "GP": "goalie_GP",
+    "GS": "goalie_GS",
+    "Min": "goalie_minutes_played",
+    "GA": "goalie_GA",
+    "GAA": "goalie_GAA",
+    "SV": "goalie_SV",
+}
+
+# XPath queries used to parse a play-by-play (PBP) page.
+# These mirror the `BeautifulSoup` lookups that were previously used,
+# but are compiled once, and evaluated by lxml directly.
+_PBP_INFO_ROWS = etree.XPath(
+    '((//td[@style="padding: 0px 30px 0px 30px" '
+    + 'and @class="d-none d-md-table-cell"])[1]'
+    + '//table[@style="border-collapse: collapse"])[1]//tr'
+)
+_PBP_TEAM_CARDS = etree.XPath(
+    '//td[@valign="center" and @class="grey_text d-none d-sm-table-cell"]'
+)
+_PBP_SECTION_CARDS = etree.XPath(
+    '//div[@class="row justify-content-md-center w-100"]'
+)
+_PBP_CARD_HEADER = etree.XPath(
+    '(.//div[contains('
+    + 'concat(" ", normalize-space(@class), " "), " card-header "'
+    + ')])[1]'
+)
+_PBP_CARD_ROWS = etree.XPath("(((.//table)[1]//tbody)[1])//tr")
+# Like the recursive `find_all("td")` it replaced,
+# this also finds cells nested inside a row's cells.
+_PBP_ROW_CELLS = etree.XPath(".//td")
+
+# NCAA levels (divisions), keyed by the values `get_field_hockey_teams()`
+# accepts for its `level` argument.
+_NCAA_LEVEL_INTS = {1: "I", 2: "II", 3: "III"}
+_NCAA_LEVEL_STRS = {
+    "i": 1,
+    "d1": 1,
+    "1": 1,
+    "ii": 2,
+    "d2": 2,
+    "2": 2,
+    "iii": 3,
+    "d3": 3,
+    "3": 3,
+}
+
+# XPath queries used to parse the team lists
+# in `get_field_hockey_teams()`.
+_TEAMS_TABLE_ROWS = etree.XPath(
+    "((//table[@id=$table_id])[1]//tbody)[1]//tr"
+)
+_TEAMS_ROW_LINK = etree.XPath("(.//a)[1]")
+_TEAMS_ROW_CELLS = etree.XPath(".//td")
+
+# XPath queries used to find the parts of a team's page
+# that `get_field_hockey_team_schedule()` needs.
+# The school and season name queries are also used on a team's roster page
+# by `get_field_hockey_team_roster()`.
+# Queries that return attribute values are compiled with
+# `smart_strings=False`, so they return plain `str` objects.
+# lxml's default "smart" strings keep a reference to their parent element,
+# which would keep the entire parsed page alive
+# for as long as the value is stored in a `DataFrame`.
+_SCHEDULE_SCHOOL_NAME = etree.XPath(
+    '(//div[contains(concat(" ", normalize-space(@class), " "), " card ")])'
+    + "[1]//img[1]/@alt",
+    smart_strings=False,
+)
+_SCHEDULE_SEASON_NAME = etree.XPath(
+    '(//select[@id="year_list"])[1]//option[@selected="selected"][1]'
+)
+_SCHEDULE_CARDS = etree.XPath('//div[@class="col p-0"]')
+_SCHEDULE_CARD_HEADER = etree.XPath(
+    '(.//div[contains('
+    + 'concat(" ", normalize-space(@class), " "), " card-header "'
+    + ')])[1]'
+)
+_SCHEDULE_CARD_HEADING = etree.XPath(
+    '(.//tr[contains('
+    + 'concat(" ", normalize-space(@class), " "), " heading "'
+    + ')])[1]//td[1]'
+)
+_SCHEDULE_CARD_TABLE = etree.XPath("(.//table)[1]")
+_SCHEDULE_TABLE_ROWS = etree.XPath(
+    './/tr[contains('
+    + 'concat(" ", normalize-space(@class), " "), " underline_rows "'
+    + ')]'
+)
+_SCHEDULE_ALL_ROWS = etree.XPath(".//tr")
+_SCHEDULE_ROW_CELLS = etree.XPath(".//td")
+
+# XPath queries used to parse a team's roster
+# in `get_field_hockey_team_roster()`.
+_ROSTER_SCHOOL_LINK = etree.XPath(
+    '((//div[contains(concat(" ", normalize-space(@class), " "), " card ")])'
+    + "[1]//a)[1]"
+)
+_ROSTER_TABLE = etree.XPath("(//table[@class=$table_class])[1]")
+_ROSTER_HEADERS = etree.XPath("(.//thead)[1]//th")
+_ROSTER_ROWS = etree.XPath("(.//tbody)[1]//tr")
+
+# XPath queries used to parse the box score tables
+# in `get_field_hockey_game_player_stats()`.
+_GAME_STATS_BOXES = etree.XPath(
+    '//div[@class="card p-0 table-responsive"]'
+)
+_GAME_STATS_TEAM_LINK = etree.XPath(
+    '(((.//div[contains('
+    + 'concat(" ", normalize-space(@class), " "), " card-header "'
+    + ')])[1]//div[contains('
+    + 'concat(" ", normalize-space(@class), " "), " row "'
+    + ')])[1]//a)[1]/@href',
+    smart_strings=False,
+)
+_GAME_STATS_TABLE = etree.XPath(
+    '(.//table[@class="display dataTable small_font"])[1]'
+)
+_GAME_STATS_HEADERS = etree.XPath("(.//thead)[1]//th")
+_GAME_STATS_ROWS = etree.XPath("(.//tbody)[1]//tr")
+
+# Regular expressions used to parse a row in a team's schedule.
+# "09/05/2024(2)" -> ("09", "05", "2024", "2")
+_SCHEDULE_DATE_RE = re.compile(
+    r"(\d{1,2})/(\d{1,2})/(\d{4})\s*(?:\(\s*(\d+)\s*\))?"
+)
+# "W 2-1 (2OT)" -> ("2", "1", "2")
+_SCHEDULE_SCORE_RE = re.compile(
+    r"(?:[WLT]\s+)?(\d+)\s*-\s*(\d+)(?:\s*\((\d*)\s*OT\s*\))?"
+)
+_CONTEST_ID_RE = re.compile(r"/contests/(\d+)")
+# Same as `_SCHEDULE_SCORE_RE`, but for a player's game log,
+# where overtime periods can be listed as "(2)" instead of "(2OT)".
+# "L 1-2 (2)" -> ("1", "2", "2")
+_GAME_LOG_SCORE_RE = re.compile(
+    r"(\d+)\s*-\s*(\d+)(?:\s*\((\d*)\s*(?:OT)?\s*\))?"
+)
+# "/teams/586482" -> "586482"
+_TEAM_ID_RE = re.compile(r"/teams?/(\d+)")
+# "/teams/586482" or "javascript:toggleDefensiveStats(586482);" -> "586482"
+_OPP_ID_RE = re.compile(r"(?:/teams?/|toggleDefensiveStats\()(\d+)")
+# "/players/8417125" -> "8417125"
+_PLAYER_ID_RE = re.compile(r"/players?/(\d+)")
+
+_ATTENDANCE_RE = re.compile(r"[0-9,]+")
+_COMMA_TABLE = str.maketrans("", "", ",")
+_QUARTER_NUM_RE = re.compile(r"[0-9]+")
+
+# For each era of NCAA field hockey rules,
+# and for each quarter number (as it's parsed from a PBP page),
+# this is the point on the game clock (in seconds)
+# where that quarter, half, and game ends.
+# Row 0 is unused, and any period past the 2nd overtime
+# uses the same values as the 2nd overtime.
+_PBP_TIME_TABLE = {
+    # In 2019, to conform to a major
+    # International Hockey Federation (IHF) rule change going from
+    # two 35 minute halves to four 15 minute quarters.
+    # https://ncaaorg.s3.amazonaws.com/championships/sports/fieldhockey/rules/2019-20PRWFH_MajorRulesModifications.pdf
+    #
+    # Starting in 2018, Field hockey overtimes
+    # were reduced from 15 minute periods,
+    # to 10 minute periods.
+    # https://www.ncaa.com/news/fieldhockey/article/2018-06-13/overtime-length-reduced-two-10-minute-periods-ncaa-field-hockey
+    "quarters": np.array(
+        [
+            [0, 0, 0],
+            [900, 1800, 3600],
+            [1800, 1800, 3600],
+            [2700, 3600, 3600],
+            [3600, 3600, 3600],
+            [4200, 4800, 4800],
+            [4800, 4800, 4800],
+        ]
+    ),
+    # Specifically in 2018, before the move to quarters,
+    # field hockey overtimes
+    # were reduced from 15 minute periods,
+    # to 10 minute periods.
+    "halves_2018": np.array(
+        [
+            [0, 0, 0],
+            [2100, 2100, 4200],
+            [4200, 4200, 4200],
+            [4800, 4800, 4800],
+            [4800, 4800, 4800],
+            [4800, 5400, 5400],
+            [4800, 4800, 4800],
+        ]
+    ),
+    "halves": np.array(
+        [
+            [0, 0, 0],
+            [2100, 2100, 4200],
+            [4200, 4200, 4200],
+            [5100, 6000, 6000],
+            [6000, 6000, 6000],
+            [5100, 6000, 6000],
+            [5100, 6000, 6000],
+        ]
+    ),
+}
+
+# For each era of NCAA field hockey rules,
+# and for each quarter number, this is the game clock string,
+# seconds remaining in the half, and seconds remaining in the game
+# for the "End of Quarter" row added at the end of that quarter.
+# Quarter 0 covers every quarter number not explicitly listed,
+# and a game clock string of `None` keeps the last event's game clock.
+_PBP_PERIOD_END_TABLE = {
+    ("quarters", 1): ("15:00", 900, 2700),
+    ("quarters", 2): ("30:00", 0, 1800),
+    ("quarters", 3): ("45:00", 900, 900),
+    ("quarters", 4): ("60:00", 0, 0),
+    ("quarters", 0): (None, 0, 0),
+    ("halves_2018", 1): ("35:00", 0, 2100),
+    ("halves_2018", 2): ("70:00", 0, 0),
+    ("halves_2018", 0): (None, 600, 600),
+    ("halves", 1): ("35:00", 0, 2100),
+    ("halves", 2): ("70:00", 0, 0),
+    ("halves", 0): (None, 0, 0),
+}
+
+
+def _get_ncaa_level(level: str | int) -> tuple[int, str]:
+    """
+    Normalizes a `level` argument into a NCAA level (division) number,
+    and the formatted name of that level used in cache file names.
+    Returns `(0, "")` if `level` isn't a known NCAA level.
+    """
+    if isinstance(level, int) and level in _NCAA_LEVEL_INTS:
+        return level, _NCAA_LEVEL_INTS[level]
+    elif isinstance(level, str) and level.lower() in _NCAA_LEVEL_STRS:
+        return _NCAA_LEVEL_STRS[level.lower()], level.upper()
+    return 0, ""
+
 
 def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
     """
@@ -67,34 +405,8 @@ def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
     home_dir = _format_folder_str(home_dir)
     teams_df = pd.DataFrame()
     teams_df_arr = []
-    temp_df = pd.DataFrame()
-    formatted_level = ""
-    ncaa_level = 0
-
-    if isinstance(level, int) and level == 1:
-        formatted_level = "I"
-        ncaa_level = 1
-    elif isinstance(level, int) and level == 2:
-        formatted_level = "II"
-        ncaa_level = 2
-    elif isinstance(level, int) and level == 3:
-        formatted_level = "III"
-        ncaa_level = 3
-    elif isinstance(level, str) and (
-        level.lower() == "i" or level.lower() == "d1" or level.lower() == "1"
-    ):
-        ncaa_level = 1
-        formatted_level = level.upper()
-    elif isinstance(level, str) and (
-        level.lower() == "ii" or level.lower() == "d2" or level.lower() == "2"
-    ):
-        ncaa_level = 2
-        formatted_level = level.upper()
-    elif isinstance(level, str) and (
-        level.lower() == "iii" or level.lower() == "d3" or level.lower() == "3"
-    ):
-        ncaa_level = 3
-        formatted_level = level.upper()
+
+    ncaa_level, formatted_level = _get_ncaa_level(level)
 
     if ncaa_level == 3 and season == 2009:
         return pd.DataFrame()
@@ -103,35 +415,14 @@ def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
         # existing at the D3 level since 1981 (kinda)
         return pd.DataFrame()
 
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/teams/"
+    cache_path = f"{cache_dir}{season}_{formatted_level}_teams.csv"
+    # `exist_ok=True` keeps this safe when several seasons/divisions
+    # are loaded at the same time by `load_field_hockey_teams()`.
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/teams/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/teams/")
-
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/teams/"
-        + f"{season}_{formatted_level}_teams.csv"
-    ):
-        teams_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/teams/"
-            + f"{season}_{formatted_level}_teams.csv"
-        )
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/field_hockey/teams/"
-                + f"{season}_{formatted_level}_teams.csv"
-            )
-        )
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
     else:
         file_mod_datetime = datetime.today()
         load_from_cache = False
@@ -142,6 +433,8 @@ def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        teams_df = pd.read_csv(cache_path)
         return teams_df
 
     logging.warning(
@@ -161,24 +454,15 @@ def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
     ranking_periods = soup.find("select", {"name": "rp", "id": "rp"})
     ranking_periods = ranking_periods.find_all("option")
 
-    rp_value = 0
-    found_value = False
-
-    while found_value is False:
-        # print("check")
-        for rp in ranking_periods:
-            if "championship" in rp.text.lower():
-                pass
-            elif "final" in rp.text.lower():
-                rp_value = rp.get("value")
-                found_value = True
-                break
-            # elif "-" in rp.text:
-            #     pass
-            else:
-                rp_value = rp.get("value")
-                found_value = True
-                break
+    # The first ranking period that isn't the championship
+    # is the final (or most recent) ranking period for this season.
+    rp_value = next(
+        (
+            rp.get("value") for rp in ranking_periods
+            if "championship" not in rp.text.lower()
+        ),
+        0
+    )
 
     url = (
         "https://stats.ncaa.org/rankings/institution_trends?"
@@ -195,11 +479,11 @@ def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
             + f"ranking_period={rp_value}&sport_code={sport_id}"
             + f"&stat_seq={stat_sequence}"
         )
-        response = _get_webpage(url=url)
+        root = _get_lxml_root(url=url)
         best_method = False
     else:
         try:
-            response = _get_webpage(url=url)
+            root = _get_lxml_root(url=url)
         except Exception as e:
             logging.info(f"Found exception when loading teams `{e}`")
             logging.info("Attempting backup method.")
@@ -209,86 +493,153 @@ def get_field_hockey_teams(season: int, level: str | int) -> pd.DataFrame:
                 + f"ranking_period={rp_value}&sport_code={sport_id}"
                 + f"&stat_seq={stat_sequence}"
             )
-            response = _get_webpage(url=url)
+            root = _get_lxml_root(url=url)
             best_method = False
-    soup = BeautifulSoup(response.text, features="lxml")
 
     if best_method is True:
-        soup = soup.find(
-            "table",
-            {"id": "stat_grid"},
-        )
-        soup = soup.find("tbody")
-        t_rows = soup.find_all("tr")
+        t_rows = _TEAMS_TABLE_ROWS(root, table_id="stat_grid")
 
         for t in t_rows:
-            team_id = t.find("a")
+            team_id = _TEAMS_ROW_LINK(t)[0]
             team_id = team_id.get("href")
             team_id = team_id.replace("/teams/", "")
             team_id = int(team_id)
-            team_name = t.find_all("td")[0].text
-            team_conference_name = t.find_all("td")[1].text
-            # del team
-            temp_df = pd.DataFrame(
-                {
-                    "season": season,
-                    "ncaa_division": ncaa_level,
-                    "ncaa_division_formatted": formatted_level,
-                    "team_conference_name": team_conference_name,
-                    "team_id": team_id,
-                    "school_name": team_name,
-                    "sport_id": sport_id,
-                },
-                index=[0],
+            t_cells = _TEAMS_ROW_CELLS(t)
+            team_name = t_cells[0].text_content()
+            team_conference_name = t_cells[1].text_content()
+            del t_cells
+            teams_df_arr.append(
+                (
+                    season,
+                    ncaa_level,
+                    formatted_level,
+                    team_conference_name,
+                    team_id,
+                    team_name,
+                    sport_id,
+                )
             )
-            teams_df_arr.append(temp_df)
-            del temp_df
     else:
-        soup = soup.find(
-            "table",
-            {"id": "rankings_table"},
-        )
-        soup = soup.find("tbody")
-        t_rows = soup.find_all("tr")
+        t_rows = _TEAMS_TABLE_ROWS(root, table_id="rankings_table")
 
         for t in t_rows:
-            team_id = t.find("a")
+            team_id = _TEAMS_ROW_LINK(t)[0]
             team_id = team_id.get("href")
             team_id = team_id.replace("/teams/", "")
             team_id = int(team_id)
-            team = t.find_all("td")[1].get("data-order")
+            team = _TEAMS_ROW_CELLS(t)[1].get("data-order")
             team_name, team_conference_name = team.split(",")
             del team
-            temp_df = pd.DataFrame(
-                {
-                    "season": season,
-                    "ncaa_division": ncaa_level,
-                    "ncaa_division_formatted": formatted_level,
-                    "team_conference_name": team_conference_name,
-                    "team_id": team_id,
-                    "school_name": team_name,
-                    "sport_id": sport_id,
-                },
-                index=[0],
+            teams_df_arr.append(
+                (
+                    season,
+                    ncaa_level,
+                    formatted_level,
+                    team_conference_name,
+                    team_id,
+                    team_name,
+                    sport_id,
+                )
             )
-            teams_df_arr.append(temp_df)
-            del temp_df
 
-    teams_df = pd.concat(teams_df_arr, ignore_index=True)
-    teams_df = pd.merge(
-        left=teams_df,
-        right=schools_df,
-        on=["school_name"],
-        how="left"
+    teams_df = pd.DataFrame.from_records(
+        teams_df_arr,
+        columns=[
+            "season",
+            "ncaa_division",
+            "ncaa_division_formatted",
+            "team_conference_name",
+            "team_id",
+            "school_name",
+            "sport_id",
+        ],
+    )
+    school_ids = dict(
+        zip(schools_df["school_name"], schools_df["school_id"])
     )
+    teams_df["school_id"] = teams_df["school_name"].map(school_ids)
+    del school_ids
     teams_df.sort_values(by=["team_id"], inplace=True)
 
-    teams_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/teams/"
-        + f"{season}_{formatted_level}_teams.csv",
-        index=False,
+    teams_df.to_csv(cache_path, index=False)
+    # Any list of teams kept in memory is now out of date.
+    _clear_field_hockey_teams_cache()
+
+    return teams_df
+
+
+# `_load_field_hockey_teams()` and `_map_field_hockey_teams_by_id()`
+# are cleared once a day
+# (the same age at which the current season's teams are re-downloaded),
+# and whenever `get_field_hockey_teams()` caches a new list of teams.
+# The lock keeps several threads from reloading every team at the same time.
+_TEAMS_CACHE_LOCK = threading.Lock()
+_teams_cache_cleared_at = datetime.now()
+
+
+def _clear_field_hockey_teams_cache() -> None:
+    """
+    Clears the in-process cache of known field hockey teams,
+    so the next lookup reads the lists of teams from disk again.
+    """
+    global _teams_cache_cleared_at
+    _load_field_hockey_teams.cache_clear()
+    _map_field_hockey_teams_by_id.cache_clear()
+    _teams_cache_cleared_at = datetime.now()
+
+
+def _expire_field_hockey_teams_cache() -> None:
+    """
+    Clears the in-process cache of known field hockey teams,
+    if it has been at least a day since it was last cleared.
+    """
+    if (datetime.now() - _teams_cache_cleared_at).days >= 1:
+        _clear_field_hockey_teams_cache()
+
+
+@lru_cache(maxsize=4)
+def _load_field_hockey_teams(start_year: int = 2009) -> pd.DataFrame:
+    """
+    Does the actual work for `load_field_hockey_teams()`.
+
+    Every function that needs to know a team's season calls
+    `load_field_hockey_teams()`, which reads in every season and division
+    of teams. Caching this here means that only happens
+    once a day per process (see `_expire_field_hockey_teams_cache()`).
+    """
+    # start_year = 2008
+    #
+
+    teams_df = pd.DataFrame()
+
+    now = datetime.now()
+    ncaa_divisions = ["I", "II", "III"]
+    ncaa_seasons = [x for x in range(start_year, (now.year + 1))]
+
+    logging.info(
+        "Loading in all NCAA field hockey teams. "
+        + "If this is the first time you're seeing this message, "
+        + "it may take some time (3-10 minutes) for this to load."
     )
+    # Each season and division is independent of the others,
+    # so several of them are loaded at once.
+    # `_get_webpage()` still sends the requests one at a time,
+    # with the usual 5-10 second wait between them,
+    # so the threads only overlap parsing and caching with that wait.
+    # `executor.map()` keeps the results in the same order
+    # as the seasons and divisions were submitted in.
+    seasons = [s for s in ncaa_seasons for _ in ncaa_divisions]
+    levels = [d for _ in ncaa_seasons for d in ncaa_divisions]
+    # Every call to `get_field_hockey_teams()` needs the list of schools.
+    # Load it before starting any threads,
+    # so they don't all try to download and cache it at the same time.
+    _get_schools()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        teams_df_arr = list(
+            executor.map(get_field_hockey_teams, seasons, levels)
+        )
 
+    teams_df = pd.concat(teams_df_arr, ignore_index=True)
     return teams_df
 
 
@@ -297,6 +648,10 @@ def load_field_hockey_teams(start_year: int = 2009) -> pd.DataFrame:
     Compiles a list of known NCAA field hockey teams
     in NCAA field hockey history.
 
+    The compiled list is kept in memory, and is reloaded
+    once a day, or after `get_field_hockey_teams()`
+    downloads a new list of teams.
+
     Parameters
     ----------
     `start_year` (int, optional):
@@ -324,31 +679,47 @@ def load_field_hockey_teams(start_year: int = 2009) -> pd.DataFrame:
     all known college field hockey teams.
 
     """
-    # start_year = 2008
-    #
+    with _TEAMS_CACHE_LOCK:
+        _expire_field_hockey_teams_cache()
+        teams_df = _load_field_hockey_teams(start_year=start_year)
+    # `_load_field_hockey_teams()` is cached in this process,
+    # so a copy is returned to keep callers from modifying the cached copy.
+    return teams_df.copy()
 
-    teams_df = pd.DataFrame()
-    teams_df_arr = []
-    temp_df = pd.DataFrame()
 
-    now = datetime.now()
-    ncaa_divisions = ["I", "II", "III"]
-    ncaa_seasons = [x for x in range(start_year, (now.year + 1))]
+@lru_cache(maxsize=1)
+def _map_field_hockey_teams_by_id() -> dict[int, dict]:
+    """
+    Maps every team ID from `load_field_hockey_teams()`
+    to the rest of that team's row,
+    so a team can be looked up without scanning every known team.
+    """
+    teams_df = _load_field_hockey_teams()
+    teams_df = teams_df.drop_duplicates(subset="team_id", keep="first")
+    return teams_df.set_index("team_id").to_dict(orient="index")
 
-    logging.info(
-        "Loading in all NCAA field hockey teams. "
-        + "If this is the first time you're seeing this message, "
-        + "it may take some time (3-10 minutes) for this to load."
-    )
-    for s in ncaa_seasons:
-        logging.info(f"Loading in field hockey teams for the {s} season.")
-        for d in ncaa_divisions:
-            temp_df = get_field_hockey_teams(season=s, level=d)
-            teams_df_arr.append(temp_df)
-            del temp_df
 
-    teams_df = pd.concat(teams_df_arr, ignore_index=True)
-    return teams_df
+def _get_field_hockey_teams_by_id() -> dict[int, dict]:
+    """
+    Returns `_map_field_hockey_teams_by_id()`,
+    after clearing it if the known teams are out of date.
+    """
+    with _TEAMS_CACHE_LOCK:
+        _expire_field_hockey_teams_cache()
+        return _map_field_hockey_teams_by_id()
+
+
+def _get_field_hockey_team_info(team_id: int) -> dict:
+    """
+    Returns the row of `load_field_hockey_teams()` for `team_id`
+    (without the `team_id` column itself).
+
+    Raises a `ValueError` if `team_id` isn't a known team ID.
+    """
+    team_info = _get_field_hockey_teams_by_id().get(team_id)
+    if team_info is None:
+        raise ValueError(f"Could not find a team with the ID {team_id}")
+    return team_info
 
 
 def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
@@ -403,8 +774,6 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
     A pandas `DataFrame` object with an NCAA field hockey team's schedule.
     """
     sport_id = "WFH"
-    schools_df = _get_schools()
-    temp_df = pd.DataFrame()
     games_df = pd.DataFrame()
     games_df_arr = []
     season = 0
@@ -415,47 +784,12 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
 
     url = f"https://stats.ncaa.org/teams/{team_id}"
 
-    team_df = load_field_hockey_teams()
-    team_df = team_df[team_df["team_id"] == team_id]
-    season = team_df["season"].iloc[0]
-    ncaa_division = team_df["ncaa_division"].iloc[0]
-    ncaa_division_formatted = team_df["ncaa_division_formatted"].iloc[0]
-    # team_conference_name = team_df["team_conference_name"].iloc[0]
-    # school_name = team_df["school_name"].iloc[0]
-    # school_id = int(team_df["school_id"].iloc[0])
-
-    del team_df
-
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/team_schedule/"
+    cache_path = f"{cache_dir}{team_id}_team_schedule.csv"
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/team_schedule/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/team_schedule/")
-
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/team_schedule/"
-        + f"{team_id}_team_schedule.csv"
-    ):
-        games_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/team_schedule/"
-            + f"{team_id}_team_schedule.csv"
-        )
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/"
-                + "field_hockey/team_schedule/"
-                + f"{team_id}_team_schedule.csv"
-            )
-        )
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
     else:
         file_mod_datetime = datetime.today()
         load_from_cache = False
@@ -463,23 +797,36 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
     now = datetime.today()
 
     age = now - file_mod_datetime
-    if age.days >= 1 and season >= now.year and now.month <= 7:
+    # This team's season only matters if the cached file is old enough
+    # to be refreshed, so every known team is only loaded if it is.
+    if (
+        age.days >= 1 and
+        now.month <= 7 and
+        _get_field_hockey_team_info(team_id)["season"] >= now.year
+    ):
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        games_df = pd.read_csv(cache_path)
         return games_df
 
-    response = _get_webpage(url=url)
-    # with open("test.html", "w+") as f:
-    #     f.write(response.text)
-    soup = BeautifulSoup(response.text, features="lxml")
+    schools_df = _get_schools()
 
-    school_name = soup.find("div", {"class": "card"}).find("img").get("alt")
-    season_name = (
-        soup.find("select", {"id": "year_list"})
-        .find("option", {"selected": "selected"})
-        .text
-    )
+    team_info = _get_field_hockey_team_info(team_id)
+    season = team_info["season"]
+    ncaa_division = team_info["ncaa_division"]
+    ncaa_division_formatted = team_info["ncaa_division_formatted"]
+    # team_conference_name = team_info["team_conference_name"]
+    # school_name = team_info["school_name"]
+    # school_id = int(team_info["school_id"])
+
+    del team_info
+
+    root = _get_lxml_root(url=url)
+
+    school_name = _SCHEDULE_SCHOOL_NAME(root)[0]
+    season_name = _SCHEDULE_SEASON_NAME(root)[0].text_content()
     # For NCAA field_hockey, the season always starts in the fall semester,
     # and ends in the spring semester.
     # Thus, if `season_name` = "2011-12",
@@ -488,31 +835,27 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
     # for NCAA member institutions.
     # season = f"{season_name[0:2]}{season_name[-2:]}"
     # season = int(season)
-    soup = soup.find_all(
-        "div",
-        {"class": "col p-0"},
-    )
 
     # declaring it here to prevent potential problems down the road.
     table_data = ""
-    for s in soup:
+    for s in _SCHEDULE_CARDS(root):
         try:
-            temp_name = s.find("div", {"class": "card-header"})
-            temp_name = temp_name.text
+            temp_name = _SCHEDULE_CARD_HEADER(s)[0]
+            temp_name = temp_name.text_content()
         except Exception as e:
             logging.warning(
                 f"Could not parse card header. Full exception `{e}`. "
                 + "Attempting alternate method."
             )
-            temp_name = s.find("tr", {"class": "heading"}).find("td").text
+            temp_name = _SCHEDULE_CARD_HEADING(s)[0].text_content()
 
         if "schedule" in temp_name.lower():
-            table_data = s.find("table")
+            table_data = _SCHEDULE_CARD_TABLE(s)[0]
 
-    t_rows = table_data.find_all("tr", {"class": "underline_rows"})
+    t_rows = _SCHEDULE_TABLE_ROWS(table_data)
 
     if len(t_rows) == 0:
-        t_rows = table_data.find_all("tr")
+        t_rows = _SCHEDULE_ALL_ROWS(table_data)
 
     for g in t_rows:
         is_valid_row = True
@@ -521,7 +864,7 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
         is_home_game = True
         is_neutral_game = False
 
-        cells = g.find_all("td")
+        cells = _SCHEDULE_ROW_CELLS(g)
         if len(cells) <= 1:
             # Because of how *well* designed
             # stats.ncaa.org is, if we have to use execute
@@ -531,23 +874,27 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
             # instead of a table data cell (`<td>`)
             continue
 
-        game_date = cells[0].text
+        game_date = cells[0].text_content()
 
         # If "(" is in the same cell as the date,
-        # this means that this game is an extra innings game.
-        # The number encased in `()` is the actual number of innings.
-        # We need to remove that from the date,
-        # and move it into a separate variable.
-        if "(" in game_date:
-            game_date = game_date.replace(")", "")
-            game_date, game_num = game_date.split("(")
-            game_date = game_date.strip()
-            game_num = int(game_num.strip())
-
-        game_date = datetime.strptime(game_date, "%m/%d/%Y").date()
+        # this means that this game is the 2nd (or later) game
+        # these two teams played on this day.
+        # The number encased in `()` is the game number for that day.
+        date_match = _SCHEDULE_DATE_RE.search(game_date)
+        if date_match is not None:
+            game_month, game_day, game_year = date_match.group(1, 2, 3)
+            game_date = date(int(game_year), int(game_month), int(game_day))
+            if date_match.group(4) is not None:
+                game_num = int(date_match.group(4))
+            del game_month, game_day, game_year
+        else:
+            # Not a date this function knows how to parse.
+            # Let `strptime()` raise the same error it always has.
+            game_date = datetime.strptime(game_date, "%m/%d/%Y").date()
+        del date_match
 
         try:
-            opp_team_id = cells[1].find("a").get("href")
+            opp_team_id = cells[1].find(".//a").get("href")
         except IndexError:
             logging.info(
                 "Skipping row because it is clearly "
@@ -569,19 +916,22 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
             raise e
 
         if is_valid_row is True:
+            # Read once, and reused below.
+            opp_cell_text = cells[1].text_content()
+
             if opp_team_id is not None:
                 opp_team_id = opp_team_id.replace("/teams/", "")
                 opp_team_id = int(opp_team_id)
 
                 try:
-                    opp_team_name = cells[1].find("img").get("alt")
+                    opp_team_name = cells[1].find(".//img").get("alt")
                 except AttributeError:
                     logging.info(
                         "Couldn't find the opposition team name "
                         + "for this row from an image element. "
                         + "Attempting a backup method"
                     )
-                    opp_team_name = cells[1].text
+                    opp_team_name = opp_cell_text
                 except Exception as e:
                     logging.info(
                         "Unhandled exception when trying to get the "
@@ -590,7 +940,7 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
                     )
                     raise e
             else:
-                opp_team_name = cells[1].text
+                opp_team_name = opp_cell_text
 
             if opp_team_name[0] == "@":
                 # The logic for determining if this game was a
@@ -601,8 +951,8 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
                 opp_team_name = opp_team_name.strip().split("@")[0]
             # opp_team_show_name = cells[1].text.strip()
 
-            opp_text = cells[1].text
-            opp_text = opp_text.strip()
+            opp_text = opp_cell_text.strip()
+            opp_text_lower = opp_text.lower()
             if "@" in opp_text and opp_text[0] == "@":
                 is_home_game = False
             elif "@" in opp_text and opp_text[0] != "@":
@@ -610,55 +960,51 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
                 is_home_game = False
             # This is just to cover conference and NCAA championship
             # tournaments.
-            elif "championship" in opp_text.lower():
+            elif "championship" in opp_text_lower:
                 is_neutral_game = True
                 is_home_game = False
-            elif "ncaa" in opp_text.lower():
+            elif "ncaa" in opp_text_lower:
                 is_neutral_game = True
                 is_home_game = False
 
-            del opp_text
+            del opp_text, opp_text_lower, opp_cell_text
 
-            score = cells[2].text.strip()
+            score = cells[2].text_content().strip()
+            score_lower = score.lower()
+            score_match = _SCHEDULE_SCORE_RE.match(score)
             if len(score) == 0:
                 score_1 = 0
                 score_2 = 0
             elif (
-                "canceled" not in score.lower() and
-                "ppd" not in score.lower()
+                "canceled" not in score_lower and
+                "ppd" not in score_lower and
+                score_match is not None
             ):
-                score_1, score_2 = score.split("-")
-
-                # `score_1` should be "W `n`", "L `n`", or "T `n`",
-                # with `n` representing the number of runs this team
-                # scored in this game.
-                # Let's remove the "W", "L", or "T" from `score_1`,
-                # and determine which team won later on in this code.
-                if any(x in score_1 for x in ["W", "L", "T"]):
-                    score_1 = score_1.split(" ")[1]
-
-                if "(" in score_2:
-                    score_2 = score_2.replace(")", "")
-                    score_2, ot_periods = score_2.split("(")
-                    ot_periods = ot_periods.replace("OT", "")
-                    ot_periods = ot_periods.replace(" ", "")
-                    ot_periods = int(ot_periods)
-
-                if ot_periods is None:
+                # `score` should be "W `n`-`m`", "L `n`-`m`", or "T `n`-`m`",
+                # with `n` representing the number of goals this team
+                # scored in this game, and optionally followed by
+                # the number of overtime periods (i.e. "(2OT)").
+                # The "W", "L", or "T" is ignored,
+                # and which team won is determined later on in this code.
+                score_1 = int(score_match.group(1))
+                score_2 = int(score_match.group(2))
+
+                if score_match.group(3) is None:
                     ot_periods = 0
-                score_1 = int(score_1)
-                score_2 = int(score_2)
+                elif len(score_match.group(3)) == 0:
+                    # "(OT)"
+                    ot_periods = 1
+                else:
+                    ot_periods = int(score_match.group(3))
             else:
                 score_1 = None
                 score_2 = None
+            del score_match, score_lower
 
             try:
-                game_id = cells[2].find("a").get("href")
+                game_id = cells[2].find(".//a").get("href")
                 game_url = f"https://stats.ncaa.org{game_id}/box_score"
-                game_id = game_id.replace("/contests", "")
-                game_id = game_id.replace("/box_score", "")
-                game_id = game_id.replace("/", "")
-                game_id = int(game_id)
+                game_id = int(_CONTEST_ID_RE.search(game_id).group(1))
             except AttributeError as e:
                 logging.info(
                     "Could not parse a game ID for this game. "
@@ -674,56 +1020,8 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
                 )
                 raise e
 
-            try:
-                attendance = cells[3].text
-                attendance = attendance.replace(",", "")
-                attendance = attendance.replace("\n", "")
-                attendance = int(attendance)
-            except IndexError as e:
-                logging.info(
-                    "It doesn't appear as if there is an attendance column "
-                    + "for this team's schedule table."
-                    f"Full exception `{e}`."
-                )
-                attendance = None
-            except ValueError as e:
-                logging.info(
-                    "There doesn't appear as if "
-                    + "there is a recorded attendance. "
-                    + "for this game/row. "
-                    f"Full exception `{e}`."
-                )
-                attendance = None
-            except Exception as e:
-                logging.info(
-                    "An unhandled exception occurred when trying "
-                    + "to find this game's attendance. "
-                    + f"Full exception `{e}`."
-                )
-                raise e
-
             if is_home_game is True:
-                temp_df = pd.DataFrame(
-                    {
-                        "season": season,
-                        "season_name": season_name,
-                        "game_id": game_id,
-                        "game_date": game_date,
-                        "game_num": game_num,
-                        "ot_periods": ot_periods,
-                        "home_team_id": team_id,
-                        "home_team_name": school_name,
-                        "away_team_id": opp_team_id,
-                        "away_team_name": opp_team_name,
-                        "home_team_score": score_1,
-                        "away_team_score": score_2,
-                        "is_neutral_game": is_neutral_game,
-                        "game_url": game_url,
-                    },
-                    index=[0],
-                )
-                games_df_arr.append(temp_df)
-                del temp_df
+                is_listed_home = True
             elif is_neutral_game is True:
                 # For the sake of simplicity,
                 # order both team ID's,
@@ -736,103 +1034,55 @@ def get_field_hockey_team_schedule(team_id: int) -> pd.DataFrame:
                 t_ids.sort()
 
                 if t_ids[0] == team_id:
-                    # home
-                    temp_df = pd.DataFrame(
-                        {
-                            "season": season,
-                            "season_name": season_name,
-                            "game_id": game_id,
-                            "game_date": game_date,
-                            "game_num": game_num,
-                            "ot_periods": ot_periods,
-                            "home_team_id": team_id,
-                            "home_team_name": school_name,
-                            "away_team_id": opp_team_id,
-                            "away_team_name": opp_team_name,
-                            "home_team_score": score_1,
-                            "away_team_score": score_2,
-                            "is_neutral_game": is_neutral_game,
-                            "game_url": game_url,
-                        },
-                        index=[0],
-                    )
+                    is_listed_home = True
                 else:
-                    # away
-                    temp_df = pd.DataFrame(
-                        {
-                            "season": season,
-                            "season_name": season_name,
-                            "game_id": game_id,
-                            "game_date": game_date,
-                            "game_num": game_num,
-                            "ot_periods": ot_periods,
-                            "home_team_id": opp_team_id,
-                            "home_team_name": opp_team_name,
-                            "away_team_id": team_id,
-                            "away_team_name": school_name,
-                            "home_team_score": score_2,
-                            "away_team_score": score_1,
-                            "is_neutral_game": is_neutral_game,
-                            "game_url": game_url,
-                        },
-                        index=[0],
-                    )
+                    is_listed_home = False
+            else:
+                is_listed_home = False
 
-                games_df_arr.append(temp_df)
-                del temp_df
+            if is_listed_home is True:
+                home_team_id, home_team_name = team_id, school_name
+                away_team_id, away_team_name = opp_team_id, opp_team_name
+                home_team_score, away_team_score = score_1, score_2
             else:
-                temp_df = pd.DataFrame(
-                    {
-                        "season": season,
-                        "season_name": season_name,
-                        "game_id": game_id,
-                        "game_date": game_date,
-                        "game_num": game_num,
-                        "ot_periods": ot_periods,
-                        "home_team_id": opp_team_id,
-                        "home_team_name": opp_team_name,
-                        "away_team_id": team_id,
-                        "away_team_name": school_name,
-                        "home_team_score": score_2,
-                        "away_team_score": score_1,
-                        "is_neutral_game": is_neutral_game,
-                        "game_url": game_url,
-                    },
-                    index=[0],
-                )
+                home_team_id, home_team_name = opp_team_id, opp_team_name
+                away_team_id, away_team_name = team_id, school_name
+                home_team_score, away_team_score = score_2, score_1
 
-                games_df_arr.append(temp_df)
-                del temp_df
+            games_df_arr.append(
+                {
+                    "season": season,
+                    "season_name": season_name,
+                    "game_id": game_id,
+                    "game_date": game_date,
+                    "game_num": game_num,
+                    "ot_periods": ot_periods,
+                    "home_team_id": home_team_id,
+                    "home_team_name": home_team_name,
+                    "away_team_id": away_team_id,
+                    "away_team_name": away_team_name,
+                    "home_team_score": home_team_score,
+                    "away_team_score": away_team_score,
+                    "is_neutral_game": is_neutral_game,
+                    "game_url": game_url,
+                }
+            )
 
         # team_photo = team_id.find("img").get("src")
 
-    games_df = pd.concat(games_df_arr, ignore_index=True)
+    games_df = pd.DataFrame.from_records(games_df_arr)
 
-    temp_df = schools_df.rename(
-        columns={
-            "school_name": "home_team_name",
-            "school_id": "home_school_id"
-        }
+    school_ids = dict(
+        zip(schools_df["school_name"], schools_df["school_id"])
     )
-    games_df = games_df.merge(right=temp_df, on="home_team_name", how="left")
-
-    temp_df = schools_df.rename(
-        columns={
-            "school_name": "away_team_name",
-            "school_id": "away_school_id"
-        }
-    )
-    games_df = games_df.merge(right=temp_df, on="away_team_name", how="left")
+    games_df["home_school_id"] = games_df["home_team_name"].map(school_ids)
+    games_df["away_school_id"] = games_df["away_team_name"].map(school_ids)
+    del school_ids
     games_df["ncaa_division"] = ncaa_division
     games_df["ncaa_division_formatted"] = ncaa_division_formatted
     games_df["sport_id"] = sport_id
     # games_df["game_url"] = games_df["game_url"].str.replace("/box_score", "")
-    games_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/"
-        + "field_hockey/team_schedule/"
-        + f"{team_id}_team_schedule.csv",
-        index=False,
-    )
+    games_df.to_csv(cache_path, index=False)
 
     return games_df
 
@@ -899,68 +1149,17 @@ def get_full_field_hockey_schedule(
     home_dir = expanduser("~")
     home_dir = _format_folder_str(home_dir)
     schedule_df = pd.DataFrame()
-    schedule_df_arr = []
-    temp_df = pd.DataFrame()
-    formatted_level = ""
-    ncaa_level = 0
-
-    if isinstance(level, int) and level == 1:
-        formatted_level = "I"
-        ncaa_level = 1
-    elif isinstance(level, int) and level == 2:
-        formatted_level = "II"
-        ncaa_level = 2
-    elif isinstance(level, int) and level == 3:
-        formatted_level = "III"
-        ncaa_level = 3
-    elif isinstance(level, str) and (
-        level.lower() == "i" or level.lower() == "d1" or level.lower() == "1"
-    ):
-        ncaa_level = 1
-        formatted_level = level.upper()
-    elif isinstance(level, str) and (
-        level.lower() == "ii" or level.lower() == "d2" or level.lower() == "2"
-    ):
-        ncaa_level = 2
-        formatted_level = level.upper()
-    elif isinstance(level, str) and (
-        level.lower() == "iii" or level.lower() == "d3" or level.lower() == "3"
-    ):
-        ncaa_level = 3
-        formatted_level = level.upper()
-
-    del level
 
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
+    ncaa_level, formatted_level = _get_ncaa_level(level)
 
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
+    del level
 
-    if exists(f"{home_dir}/.ncaa_stats_py/" + "field_hockey/full_schedule/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/" + "field_hockey/full_schedule/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/full_schedule/"
+    cache_path = f"{cache_dir}{season}_{formatted_level}_full_schedule.csv"
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/full_schedule/"
-        + f"{season}_{formatted_level}_full_schedule.csv"
-    ):
-        teams_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/full_schedule/"
-            + f"{season}_{formatted_level}_full_schedule.csv"
-        )
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/"
-                + "field_hockey/full_schedule/"
-                + f"{season}_{formatted_level}_full_schedule.csv"
-            )
-        )
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
     else:
         file_mod_datetime = datetime.today()
         load_from_cache = False
@@ -973,6 +1172,8 @@ def get_full_field_hockey_schedule(
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        teams_df = pd.read_csv(cache_path)
         return teams_df
 
     teams_df = load_field_hockey_teams()
@@ -980,21 +1181,29 @@ def get_full_field_hockey_schedule(
         (teams_df["season"] == season) &
         (teams_df["ncaa_division"] == ncaa_level)
     ]
-    team_ids_arr = teams_df["team_id"].to_numpy()
-
-    for team_id in tqdm(team_ids_arr):
-        temp_df = get_field_hockey_team_schedule(team_id=team_id)
-        schedule_df_arr.append(temp_df)
+    # `.tolist()` hands `get_field_hockey_team_schedule()` Python `int`s,
+    # instead of NumPy scalars.
+    team_ids_arr = teams_df["team_id"].astype(int).tolist()
+
+    # Team schedules are independent of each other,
+    # so several of them are loaded at once.
+    # Every team in the division needs its own request,
+    # but `_get_webpage()` still sends them one at a time,
+    # with the usual 5-10 second wait between them.
+    # `executor.map()` keeps the schedules in the same order as
+    # `team_ids_arr`, so `drop_duplicates()` keeps the same rows below.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        schedule_df_arr = list(
+            tqdm(
+                executor.map(get_field_hockey_team_schedule, team_ids_arr),
+                total=len(team_ids_arr)
+            )
+        )
 
     schedule_df = pd.concat(schedule_df_arr, ignore_index=True)
     schedule_df = schedule_df.drop_duplicates(subset="game_id", keep="first")
     schedule_df["sport_id"] = sport_id
-    schedule_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/"
-        + "field_hockey/full_schedule/"
-        + f"{season}_{formatted_level}_full_schedule.csv",
-        index=False,
-    )
+    schedule_df.to_csv(cache_path, index=False)
     return schedule_df
 
 
@@ -1047,55 +1256,18 @@ def get_field_hockey_team_roster(team_id: int) -> pd.DataFrame:
     """
     sport_id = "WFH"
     roster_df = pd.DataFrame()
-    roster_df_arr = []
-    temp_df = pd.DataFrame()
+    roster_rows = []
     url = f"https://stats.ncaa.org/teams/{team_id}/roster"
     load_from_cache = True
     home_dir = expanduser("~")
     home_dir = _format_folder_str(home_dir)
 
-    team_df = load_field_hockey_teams()
-
-    team_df = team_df[team_df["team_id"] == team_id]
-
-    season = team_df["season"].iloc[0]
-    ncaa_division = team_df["ncaa_division"].iloc[0]
-    ncaa_division_formatted = team_df["ncaa_division_formatted"].iloc[0]
-    team_conference_name = team_df["team_conference_name"].iloc[0]
-    school_name = team_df["school_name"].iloc[0]
-    school_id = int(team_df["school_id"].iloc[0])
-
-    del team_df
-
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/"
+    cache_path = f"{cache_dir}{team_id}_roster.csv"
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/")
-
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/" +
-        f"{team_id}_roster.csv"
-    ):
-        teams_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/" +
-            f"{team_id}_roster.csv"
-        )
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/"
-                + f"{team_id}_roster.csv"
-            )
-        )
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
     else:
         file_mod_datetime = datetime.today()
         load_from_cache = False
@@ -1104,29 +1276,39 @@ def get_field_hockey_team_roster(team_id: int) -> pd.DataFrame:
 
     age = now - file_mod_datetime
 
-    if age.days >= 14 and season >= now.year and now.month <= 7:
+    # This team's season only matters if the cached file is old enough
+    # to be refreshed, so every known team is only loaded if it is.
+    if (
+        age.days >= 14 and
+        now.month <= 7 and
+        _get_field_hockey_team_info(team_id)["season"] >= now.year
+    ):
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        teams_df = pd.read_csv(cache_path)
         return teams_df
 
-    response = _get_webpage(url=url)
-    with open("test.html", "w+") as f:
-        f.write(response.text)
-    soup = BeautifulSoup(response.text, features="lxml")
+    team_info = _get_field_hockey_team_info(team_id)
+
+    season = team_info["season"]
+    ncaa_division = team_info["ncaa_division"]
+    ncaa_division_formatted = team_info["ncaa_division_formatted"]
+    team_conference_name = team_info["team_conference_name"]
+    school_name = team_info["school_name"]
+    school_id = int(team_info["school_id"])
+
+    del team_info
+
+    root = _get_lxml_root(url=url)
     try:
-        school_name = soup.find("div", {"class": "card"}).find("img").get(
-            "alt"
-        )
-    except Exception:
-        school_name = soup.find("div", {"class": "card"}).find("a").text
+        school_name = _SCHEDULE_SCHOOL_NAME(root)[0]
+    except IndexError:
+        school_name = _ROSTER_SCHOOL_LINK(root)[0].text_content()
         school_name = school_name.rsplit(" ", maxsplit=1)[0]
 
-    season_name = (
-        soup.find("select", {"id": "year_list"})
-        .find("option", {"selected": "selected"})
-        .text
-    )
+    season_name = _SCHEDULE_SEASON_NAME(root)[0].text_content()
     # For NCAA field_hockey, the season always starts in the spring semester,
     # and ends in the fall semester.
     # Thus, if `season_name` = "2011-12",
@@ -1137,47 +1319,36 @@ def get_field_hockey_team_roster(team_id: int) -> pd.DataFrame:
     season = int(season)
 
     try:
-        table = soup.find(
-            "table",
-            {"class": "dataTable small_font"},
-        )
-
-        table_headers = table.find("thead").find_all("th")
-    except Exception:
-        table = soup.find(
-            "table",
-            {"class": "dataTable small_font no_padding"},
-        )
+        table = _ROSTER_TABLE(root, table_class="dataTable small_font")[0]
+    except IndexError:
+        table = _ROSTER_TABLE(
+            root, table_class="dataTable small_font no_padding"
+        )[0]
 
-        table_headers = table.find("thead").find_all("th")
-    table_headers = [x.text for x in table_headers]
+    table_headers = [x.text_content() for x in _ROSTER_HEADERS(table)]
 
-    t_rows = table.find("tbody").find_all("tr")
+    t_rows = _ROSTER_ROWS(table)
 
     for t in t_rows:
-        t_cells = t.find_all("td")
-        t_cells = [x.text for x in t_cells]
+        t_cells = t.findall(".//td")
+        t_cells = [x.text_content() for x in t_cells]
 
-        temp_df = pd.DataFrame(
-            data=[t_cells],
-            columns=table_headers,
-            # index=[0]
-        )
-
-        player_id = t.find("a").get("href")
-        # temp_df["school_name"] = school_name
-        temp_df["player_url"] = f"https://stats.ncaa.org{player_id}"
-
-        player_id = player_id.replace("/players", "").replace("/", "")
-        player_id = int(player_id)
-
-        temp_df["player_id"] = player_id
+        # t_cells.append(school_name)
+        t_cells.append(t.find(".//a").get("href"))
 
-        roster_df_arr.append(temp_df)
-        del temp_df
+        roster_rows.append(t_cells)
 
-    roster_df = pd.concat(roster_df_arr, ignore_index=True)
-    roster_df = roster_df.infer_objects()
+    roster_df = pd.DataFrame(
+        data=roster_rows,
+        columns=table_headers + ["player_url"],
+    )
+    # `player_url` only holds the link path (e.g. "/players/8417125") here.
+    roster_df["player_id"] = roster_df["player_url"].str.extract(
+        _PLAYER_ID_RE, expand=False
+    ).astype("int64")
+    roster_df["player_url"] = (
+        "https://stats.ncaa.org" + roster_df["player_url"]
+    )
     roster_df["season"] = season
     roster_df["season_name"] = season_name
     roster_df["ncaa_division"] = ncaa_division
@@ -1186,11 +1357,7 @@ def get_field_hockey_team_roster(team_id: int) -> pd.DataFrame:
     roster_df["school_id"] = school_id
     roster_df["school_name"] = school_name
     roster_df["sport_id"] = sport_id
-    roster_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/rosters/" +
-        f"{team_id}_roster.csv",
-        index=False,
-    )
+    roster_df.to_csv(cache_path, index=False)
     return roster_df
 
 
@@ -1257,18 +1424,16 @@ def get_field_hockey_player_season_stats(
     # stats_df_arr = []
     temp_df = pd.DataFrame()
 
-    team_df = load_field_hockey_teams()
+    team_info = _get_field_hockey_team_info(team_id)
 
-    team_df = team_df[team_df["team_id"] == team_id]
+    season = team_info["season"]
+    ncaa_division = team_info["ncaa_division"]
+    ncaa_division_formatted = team_info["ncaa_division_formatted"]
+    team_conference_name = team_info["team_conference_name"]
+    school_name = team_info["school_name"]
+    school_id = int(team_info["school_id"])
 
-    season = team_df["season"].iloc[0]
-    ncaa_division = team_df["ncaa_division"].iloc[0]
-    ncaa_division_formatted = team_df["ncaa_division_formatted"].iloc[0]
-    team_conference_name = team_df["team_conference_name"].iloc[0]
-    school_name = team_df["school_name"].iloc[0]
-    school_id = int(team_df["school_id"].iloc[0])
-
-    del team_df
+    del team_info
 
     players_stat_id = _get_stat_id(
         sport="field_hockey", season=season, stat_type="non_goalkeepers"
@@ -1291,37 +1456,14 @@ def get_field_hockey_player_season_stats(
         + f"year_stat_category_id={goalkeepers_stat_id}"
     )
 
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/player_season_stats/"
+    cache_path = (
+        f"{cache_dir}{season:00d}_{school_id:00d}_player_season_stats.csv"
+    )
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/player_season_stats/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/player_season_stats/")
-
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/player_season_stats/"
-        + f"{season:00d}_{school_id:00d}_player_season_stats.csv"
-    ):
-        games_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/player_season_stats/"
-            + f"{season:00d}_{school_id:00d}_player_season_stats.csv"
-        )
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/field_hockey/"
-                + "player_season_stats/"
-                + f"{season:00d}_{school_id:00d}"
-                + "_player_season_stats.csv"
-            )
-        )
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
     else:
         file_mod_datetime = datetime.today()
         load_from_cache = False
@@ -1334,6 +1476,8 @@ def get_field_hockey_player_season_stats(
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        games_df = pd.read_csv(cache_path)
         return games_df
 
     for url in [players_url, gk_url]:
@@ -1493,12 +1637,10 @@ def get_field_hockey_player_season_stats(
     stats_df["sport_id"] = sport_id
 
     stats_df = stats_df.infer_objects()
-
-    stats_df = stats_df.infer_objects()
+    # `season` is re-read from the stats page above,
+    # so the file name is built again here.
     stats_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/"
-        + "player_season_stats/"
-        + f"{season:00d}_{school_id:00d}_player_season_stats.csv",
+        f"{cache_dir}{season:00d}_{school_id:00d}_player_season_stats.csv",
         index=False,
     )
 
@@ -1571,10 +1713,8 @@ def get_field_hockey_player_game_stats(
     load_from_cache = True
 
     stats_df = pd.DataFrame()
-    stats_df_arr = []
     init_df = pd.DataFrame()
-    init_df_arr = []
-    temp_df = pd.DataFrame()
+    game_rows = []
     home_dir = expanduser("~")
     home_dir = _format_folder_str(home_dir)
 
@@ -1585,37 +1725,12 @@ def get_field_hockey_player_game_stats(
     # )
     url = f"https://stats.ncaa.org/players/{player_id}"
 
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/player_game_stats/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/player_game_stats/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/player_game_stats/"
+    cache_path = f"{cache_dir}{season}_{player_id}_player_game_stats.csv"
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/player_game_stats/"
-        + f"{season}_{player_id}_player_game_stats.csv"
-    ):
-        games_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/player_game_stats/"
-            + f"{season}_{player_id}_player_game_stats.csv"
-        )
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/field_hockey/"
-                + "player_game_stats/"
-                + f"{season}_{player_id}_player_game_stats.csv"
-            )
-        )
-        games_df = games_df.infer_objects()
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
         load_from_cache = True
     else:
         file_mod_datetime = datetime.today()
@@ -1632,10 +1747,21 @@ def get_field_hockey_player_game_stats(
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        # `read_csv()` already infers the type of every column.
+        games_df = pd.read_csv(cache_path)
         return games_df
 
     response = _get_webpage(url=url)
-    soup = BeautifulSoup(response.text, features="lxml")
+    # Only the stat tables on this page are used,
+    # so nothing else on the page is turned into `BeautifulSoup` objects.
+    soup = BeautifulSoup(
+        response.text,
+        features="lxml",
+        parse_only=SoupStrainer(
+            "table", {"class": "small_font dataTable table-bordered"}
+        ),
+    )
 
     # table_navigation = soup.find("ul", {"class": "nav nav-tabs padding-nav"})
     # table_nav_card = table_navigation.find_all("a")
@@ -1649,6 +1775,17 @@ def get_field_hockey_player_game_stats(
 
     del temp_table_headers
 
+    # Columns that share a header are dropped from the game log entirely,
+    # so work out which cells to keep once instead of on every row.
+    table_headers = [
+        {"Opponent": "opponent", "Date": "date"}.get(x, x)
+        for x in table_headers
+    ]
+    kept_cells = [
+        (i, x) for i, x in enumerate(table_headers)
+        if table_headers.count(x) == 1
+    ]
+
     temp_t_rows = table_data.find("tbody")
     temp_t_rows = temp_t_rows.find_all("tr")
 
@@ -1663,8 +1800,8 @@ def get_field_hockey_player_game_stats(
             continue
         del row_id
 
-        t_cells = t.find_all("td")
-        t_cells = [x.text.strip() for x in t_cells]
+        t_tds = t.find_all("td")
+        t_cells = [x.text.strip() for x in t_tds]
 
         g_date = t_cells[0]
 
@@ -1676,7 +1813,7 @@ def get_field_hockey_player_game_stats(
             game_num = int(game_num)
 
         try:
-            opp_team_id = t.find_all("td")[1].find("a").get("href")
+            opp_team_id = t_tds[1].find("a").get("href")
         except AttributeError as e:
             logging.info(
                 "Could not extract a team ID for this game. " +
@@ -1691,14 +1828,7 @@ def get_field_hockey_player_game_stats(
             raise e
 
         try:
-            opp_team_id = opp_team_id.replace("/teams/", "")
-            opp_team_id = opp_team_id.replace(
-                "javascript:toggleDefensiveStats(", ""
-            )
-            opp_team_id = opp_team_id.replace(");", "")
-            opp_team_id = int(opp_team_id)
-
-            temp_df["opponent_team_id"] = opp_team_id
+            opp_team_id = int(_OPP_ID_RE.search(opp_team_id).group(1))
         except Exception:
             logging.info(
                 "Couldn't find the opposition team naIDme "
@@ -1707,7 +1837,7 @@ def get_field_hockey_player_game_stats(
             opp_team_id = None
         # print(i.find("td").text)
         try:
-            opp_team_name = t.find_all("td")[1].find_all("img")[1].get("alt")
+            opp_team_name = t_tds[1].find_all("img")[1].get("alt")
         except AttributeError:
             logging.info(
                 "Couldn't find the opposition team name "
@@ -1736,86 +1866,58 @@ def get_field_hockey_player_game_stats(
         if "@" in opp_team_name:
             opp_team_name = opp_team_name.split("@")[0]
 
-        result_str = t_cells[2]
-
-        result_str = (
-            result_str.lower().replace("w", "").replace("l", "").replace(
-                "t", ""
-            )
-        )
-
-        if (
-            result_str.lower() == "ppd" or
-            result_str.lower() == "" or
-            result_str.lower() == "canceed"
-        ):
+        # Postponed ("PPD"), canceled, and unplayed games
+        # don't have a score, and are skipped.
+        score_match = _GAME_LOG_SCORE_RE.search(t_cells[2])
+        if score_match is None:
             continue
 
-        result_str = result_str.replace("\n", "")
-        result_str = result_str.replace("*", "")
-
-        tm_score, opp_score = result_str.split("-")
-        t_cells = [x.replace("*", "") for x in t_cells]
-        t_cells = [x.replace("/", "") for x in t_cells]
-        t_cells = [x.replace("\\", "") for x in t_cells]
-
-        temp_df = pd.DataFrame(
-            data=[t_cells],
-            columns=table_headers,
-            # index=[0]
-        )
+        t_cells = [x.translate(_STRIP_TABLE) for x in t_cells]
 
-        tm_score = int(tm_score)
-        if "(" in opp_score:
-            opp_score = opp_score.replace(")", "")
-            opp_score, ot_periods = opp_score.split("(")
-            temp_df["ot_periods"] = ot_periods
+        game_row = {x: t_cells[i] for i, x in kept_cells}
 
-        if "\n" in opp_score:
-            opp_score = opp_score.strip()
-            # opp_score = opp_score
-        opp_score = int(opp_score)
+        tm_score = int(score_match.group(1))
+        opp_score = int(score_match.group(2))
+        if score_match.group(3) is not None:
+            # "(OT)" is a single overtime period.
+            ot_periods = int(score_match.group(3) or 1)
+            game_row["ot_periods"] = ot_periods
+        del score_match
 
-        temp_df["team_score"] = tm_score
-        temp_df["opponent_score"] = opp_score
+        game_row["team_score"] = tm_score
+        game_row["opponent_score"] = opp_score
 
         del tm_score
         del opp_score
 
-        g_id = t.find_all("td")[2].find("a").get("href")
-
-        g_id = g_id.replace("/contests", "")
-        g_id = g_id.replace("/box_score", "")
-        g_id = g_id.replace("/", "")
-
-        g_id = int(g_id)
-        temp_df["game_id"] = g_id
+        g_id = t_tds[2].find("a").get("href")
+        g_id = int(_CONTEST_ID_RE.search(g_id).group(1))
+        game_row["game_id"] = g_id
 
         del g_id
-        temp_df.rename(
-            columns={"Opponent": "opponent", "Date": "date"},
-            inplace=True,
-        )
-        game_date = datetime.strptime(g_date, "%m/%d/%Y").date()
-
-        temp_df["date"] = game_date
-        temp_df["game_num"] = game_num
-        # temp_df["game_innings"] = innings
+        # Parsed all at once after this loop.
+        game_row["date"] = g_date
+        game_row["game_num"] = game_num
+        # game_row["game_innings"] = innings
 
         if len(opp_team_name) > 0:
-            temp_df["opponent"] = opp_team_name
+            game_row["opponent"] = opp_team_name
         del opp_team_name
 
-        duplicate_cols = temp_df.columns[temp_df.columns.duplicated()]
-        temp_df.drop(columns=duplicate_cols, inplace=True)
-
-        init_df_arr.append(temp_df)
-        del temp_df
-
-    init_df = pd.concat(init_df_arr, ignore_index=True)
-    init_df = init_df.replace("/", "", regex=True)
+        game_rows.append(game_row)
+        del game_row
+
+    init_df = pd.DataFrame.from_records(game_rows)
+    init_df["date"] = pd.to_datetime(
+        init_df["date"], format="%m/%d/%Y", cache=True
+    ).dt.date
+    # Table cells have already had "/" stripped out as they were read in,
+    # so only the opponent names added in the loop above need to be cleaned.
+    if "opponent" in init_df.columns:
+        init_df["opponent"] = init_df["opponent"].str.replace(
+            "/", "", regex=False
+        )
     init_df = init_df.replace("", np.nan)
-    init_df = init_df.infer_objects()
 
     # print(stats_df)
     init_df["GP"] = init_df["GP"].fillna("0")
@@ -1828,23 +1930,25 @@ def get_field_hockey_player_game_stats(
     # time.sleep(2)
 
     print(f"Loading for player game stats for player ID `{player_id}`")
-    count = 0
-    game_ids_len = len(game_ids_arr)
-    for game_id in game_ids_arr:
-        count += 1
-        print(f"On game {count} of {game_ids_len}")
-        df = get_field_hockey_game_player_stats(game_id)
-        stats_df_arr.append(df)
-        del df
+    # Load every known team before starting any threads.
+    # Otherwise, each thread would try to load (and cache to disk)
+    # the same teams at the same time.
+    _get_field_hockey_teams_by_id()
+    # `_get_webpage()` still sends the box score requests one at a time,
+    # with the usual 5-10 second wait between them,
+    # so the threads only overlap parsing and caching with that wait.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        stats_df_arr = list(
+            tqdm(
+                executor.map(get_field_hockey_game_player_stats, game_ids_arr),
+                total=len(game_ids_arr)
+            )
+        )
 
     stats_df = pd.concat(stats_df_arr, ignore_index=True)
     stats_df = stats_df[stats_df["player_id"] == player_id]
 
-    stats_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/player_game_stats/"
-        + f"{season}_{player_id}_player_game_stats.csv",
-        index=False
-    )
+    stats_df.to_csv(cache_path, index=False)
     return stats_df
 
 
@@ -1920,7 +2024,6 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
     sport_id = "WFH"
     load_from_cache = True
     season = 0
-    team_df = load_field_hockey_teams()
 
     stats_df = pd.DataFrame()
 
@@ -1930,76 +2033,20 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
     gk_df = pd.DataFrame()
     gk_df_arr = []
 
-    temp_df = pd.DataFrame()
     home_dir = expanduser("~")
     home_dir = _format_folder_str(home_dir)
 
-    stat_columns = [
-        "season",
-        "game_id",
-        "sport_id",
-        "team_id",
-        "player_id",
-        "player_jersey_number",
-        "player_full_name",
-        "player_positions",
-        "player_GP",
-        "player_MP",
-        "player_seconds_played",
-        "player_G",
-        "player_SH",
-        "player_AST",
-        "player_SOG",
-        "player_Fouls",
-        "player_YC",
-        "player_GC",
-        "player_RC",
-        "player_PTS",
-        "goalie_GP",
-        "goalie_minutes_played",
-        "goalie_seconds_played",
-        "goalie_GA",
-        "goalie_SV",
-        "goalie_GAA",
-    ]
-
     url = f"https://stats.ncaa.org/contests/{game_id}/individual_stats"
 
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/"
+    cache_path = f"{cache_dir}{game_id}_player_game_stats.csv"
+    # `exist_ok=True` matters here, because this function is called
+    # from several threads at once by
+    # `get_field_hockey_player_game_stats()`.
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/")
-
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/"
-        + f"{game_id}_player_game_stats.csv"
-    ):
-        games_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/"
-            + f"{game_id}_player_game_stats.csv"
-        )
-        games_df = games_df.infer_objects()
-        file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/"
-                + f"{game_id}_player_game_stats.csv"
-            )
-        )
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
         load_from_cache = True
     else:
         file_mod_datetime = datetime.today()
@@ -2013,76 +2060,79 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
         load_from_cache = False
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        # `read_csv()` already infers the type of every column.
+        games_df = pd.read_csv(cache_path)
         return games_df
 
-    response = _get_webpage(url=url)
-    soup = BeautifulSoup(response.text, features="lxml")
+    root = _get_lxml_root(url=url)
 
     # table_data = soup.find_all(
     #     "table",
     #     {"class": "small_font dataTable table-bordered"}
     # )[1]
-    table_boxes = soup.find_all("div", {"class": "card p-0 table-responsive"})
+    table_boxes = _GAME_STATS_BOXES(root)
 
     for box in table_boxes:
-        t_header = box.find("div", {"class": "card-header"}).find(
-            "div", {"class": "row"}
-        )
-        # t_header_str = t_header.text
-        team_id = t_header.find("a").get("href")
-        team_id = team_id.replace("/teams", "")
-        team_id = team_id.replace("/", "")
-        team_id = int(team_id)
-
-        table_data = box.find(
-            "table", {"class": "display dataTable small_font"}
+        team_id = _GAME_STATS_TEAM_LINK(box)[0]
+        team_id = int(_TEAM_ID_RE.search(team_id).group(1))
+
+        table_data = _GAME_STATS_TABLE(box)[0]
+        table_headers = tuple(
+            x.text_content() for x in _GAME_STATS_HEADERS(box)
         )
-        table_headers = box.find("thead").find_all("th")
-        table_headers = [x.text for x in table_headers]
 
-        temp_t_rows = table_data.find("tbody")
-        temp_t_rows = temp_t_rows.find_all("tr")
+        # Goalie GAA values can have thousands separators (e.g. "1,002.50").
+        # Remove them as the rows are read in,
+        # so the column can be cast directly to a float later.
+        if "GAA" in table_headers:
+            gaa_index = table_headers.index("GAA")
+        else:
+            gaa_index = None
 
-        spec_stats_df = pd.DataFrame()
-        spec_stats_df_arr = []
+        temp_t_rows = _GAME_STATS_ROWS(table_data)
+
+        spec_stats_rows = []
         for t in temp_t_rows:
             # row_id = t.get("id")
             # game_played = 1
             # game_started = 1
             try:
-                player_id = t.find("a").get("href")
-                player_id = player_id.replace("/players", "")
-                player_id = player_id.replace("/player", "")
-                player_id = player_id.replace("/", "")
+                player_id = t.find(".//a").get("href")
+                player_id = _PLAYER_ID_RE.search(player_id).group(1)
             except Exception as e:
                 logging.debug(
                     "Could not replace player IDs. " + f"Full exception: `{e}`"
                 )
                 player_id = team_id * -1
 
-            t_cells = t.find_all("td")
-            # p_name = t_cells[1].text.replace("\n", "")
+            t_cells = t.findall(".//td")
+            # p_name = t_cells[1].text_content().replace("\n", "")
             # if "\xa0" in p_name:
             #     game_started = 0
-            t_cells = [x.text.strip() for x in t_cells]
+            t_cells = [x.text_content().strip() for x in t_cells]
             player_id = int(player_id)
 
-            temp_df = pd.DataFrame(data=[t_cells], columns=table_headers)
-            temp_df["player_id"] = player_id
-            # temp_df["GP"] = game_played
-            # temp_df["GS"] = game_started
-            spec_stats_df_arr.append(temp_df)
+            if gaa_index is not None:
+                t_cells[gaa_index] = t_cells[gaa_index].replace(",", "")
+
+            t_cells.append(player_id)
+            # t_cells.append(game_played)
+            # t_cells.append(game_started)
+            spec_stats_rows.append(t_cells)
 
-        spec_stats_df = pd.concat(spec_stats_df_arr, ignore_index=True)
+        spec_stats_df = pd.DataFrame(
+            data=spec_stats_rows,
+            columns=table_headers + ("player_id",),
+        )
+        del spec_stats_rows
         spec_stats_df["team_id"] = team_id
         spec_stats_df = spec_stats_df[
             (spec_stats_df["player_id"] > 0) |
             (spec_stats_df["Name"] == "TEAM")
         ]
 
-        df = team_df[team_df["team_id"] == team_id]
-        season = df["season"].iloc[0]
-        del df
+        season = _get_field_hockey_team_info(team_id)["season"]
 
         if "GA" in table_headers:
             # This means that it's goalie data,
@@ -2095,31 +2145,7 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
         del spec_stats_df
 
     players_df = pd.concat(players_df_arr, ignore_index=True)
-    players_df.rename(
-        columns={
-            "#": "player_jersey_number",
-            "Player": "player_full_name",
-            "Name": "player_full_name",
-            "Yr": "player_class",
-            "Pos": "player_positions",
-            "P": "player_positions",
-            "G": "player_GP",
-            "MP": "player_MP",
-            "GP": "player_GP",
-            "GS": "player_GS",
-            "Goals": "player_G",
-            "SoG": "player_SOG",
-            "AST": "player_AST",
-            "PTS": "player_PTS",
-            "ShAtt": "player_SH",
-            "Fouls": "player_Fouls",
-            "RC": "player_RC",
-            "YC": "player_YC",
-            "GC": "player_GC",
-            "DSv": "player_DSV",
-        },
-        inplace=True,
-    )
+    players_df.rename(columns=_PLAYERS_RENAME, inplace=True)
     if "player_MP" in players_df.columns:
 
         players_df["player_seconds_played"] = players_df["player_MP"].map(
@@ -2127,23 +2153,7 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
         )
 
     gk_df = pd.concat(gk_df_arr, ignore_index=True)
-    gk_df.rename(
-        columns={
-            "#": "player_jersey_number",
-            "Player": "player_full_name",
-            "Name": "player_full_name",
-            "Yr": "player_class",
-            "Pos": "player_positions",
-            "P": "player_positions",
-            "GP": "goalie_GP",
-            "GS": "goalie_GS",
-            "Min": "goalie_minutes_played",
-            "GA": "goalie_GA",
-            "GAA": "goalie_GAA",
-            "SV": "goalie_SV",
-        },
-        inplace=True,
-    )
+    gk_df.rename(columns=_GK_RENAME, inplace=True)
     gk_df["goalie_GP"] = 1
 
     gk_df["goalie_seconds_played"] = gk_df["goalie_minutes_played"].map(
@@ -2168,19 +2178,17 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
 
     stats_df["game_id"] = game_id
     stats_df["sport_id"] = sport_id
-    for i in stats_df.columns:
-        if i in stat_columns:
-            pass
-        else:
-            raise ValueError(f"Unhandled column name {i}")
+    unhandled_cols = set(stats_df.columns) - _GAME_PLAYER_STAT_COLUMNS_SET
+    if len(unhandled_cols) > 0:
+        raise ValueError(
+            f"Unhandled column name(s) {sorted(unhandled_cols)}"
+        )
 
-    stats_df = stats_df.reindex(columns=stat_columns)
+    stats_df = stats_df.reindex(columns=_GAME_PLAYER_STAT_COLUMNS)
 
     # print(stats_df.columns)
 
     stats_df = stats_df.infer_objects().fillna(0)
-    stats_df["goalie_GAA"] = stats_df["goalie_GAA"].astype("string")
-    stats_df["goalie_GAA"] = stats_df["goalie_GAA"].str.replace(",", "")
     stats_df["season"] = season
     stats_df = stats_df.astype(
         {
@@ -2204,17 +2212,14 @@ def get_field_hockey_game_player_stats(game_id: int) -> pd.DataFrame:
             "goalie_minutes_played": "string",
             "goalie_GA": "uint16",
             "goalie_SV": "uint16",
-            "goalie_GAA": "float32",
             "goalie_GP": "uint16",
         }
     )
-    stats_df["goalie_GAA"] = stats_df["goalie_GAA"].round(3)
+    stats_df["goalie_GAA"] = pd.to_numeric(
+        stats_df["goalie_GAA"], errors="coerce"
+    ).astype("float32").round(3)
 
-    stats_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/player/"
-        + f"{game_id}_player_game_stats.csv",
-        index=False
-    )
+    stats_df.to_csv(cache_path, index=False)
     return stats_df
 
 
@@ -2286,33 +2291,62 @@ def get_field_hockey_game_team_stats(game_id: int) -> pd.DataFrame:
     ----------
     A pandas `DataFrame` object with team game stats in a given game.
     """
+    load_from_cache = True
+    home_dir = expanduser("~")
+    home_dir = _format_folder_str(home_dir)
+
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/game_stats/team/"
+    cache_path = f"{cache_dir}{game_id}_team_game_stats.csv"
+    makedirs(cache_dir, exist_ok=True)
+
+    if exists(cache_path):
+        file_mod_datetime = datetime.fromtimestamp(getmtime(cache_path))
+        load_from_cache = True
+    else:
+        file_mod_datetime = datetime.today()
+        load_from_cache = False
+
+    now = datetime.today()
+
+    age = now - file_mod_datetime
+
+    if age.days >= 35:
+        load_from_cache = False
+
+    if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        games_df = pd.read_csv(cache_path, dtype=_GAME_TEAM_STAT_DTYPES)
+        return games_df
+
+    # Already cast to the right types by
+    # `get_field_hockey_game_player_stats()`.
     df = get_field_hockey_game_player_stats(game_id=game_id)
-    df = df.infer_objects()
-    print(df.columns)
 
     stats_df = df.groupby(
         ["season", "game_id", "team_id"],
-        as_index=False
-    ).agg(
-        {
-            "player_seconds_played": "sum",
-            "player_G": "sum",
-            "player_SH": "sum",
-            "player_AST": "sum",
-            "player_SOG": "sum",
-            "player_Fouls": "sum",
-            "player_YC": "sum",
-            "player_GC": "sum",
-            "player_RC": "sum",
-            "player_PTS": "sum",
-            "goalie_GP": "sum",
-            # "goalie_minutes_played":"",
-            "goalie_seconds_played": "sum",
-            "goalie_GA": "sum",
-            "goalie_SV": "sum",
-        }
-    )
+        as_index=False,
+    )[
+        [
+            "player_seconds_played",
+            "player_G",
+            "player_SH",
+            "player_AST",
+            "player_SOG",
+            "player_Fouls",
+            "player_YC",
+            "player_GC",
+            "player_RC",
+            "player_PTS",
+            "goalie_GP",
+            # "goalie_minutes_played",
+            "goalie_seconds_played",
+            "goalie_GA",
+            "goalie_SV",
+        ]
+    ].sum()
+    stats_df = stats_df.astype(_GAME_TEAM_STAT_DTYPES)
 
+    stats_df.to_csv(cache_path, index=False)
     return stats_df
 
 
@@ -2415,19 +2449,23 @@ def get_field_hockey_raw_pbp(game_id: int) -> pd.DataFrame:
     season = 0
     away_score = 0
     home_score = 0
-
-    quarter_seconds_remaining = 0
-    half_seconds_remaining = 0
-    game_seconds_remaining = 0
+    t_secs = 0
 
     # teams_df = load_field_hockey_teams()
     # team_ids_arr = teams_df["team_id"].to_list()
 
-    pbp_df = pd.DataFrame()
-    pbp_df_arr = []
-    temp_df = pd.DataFrame()
+    # Each parsed event is added to these lists,
+    # and the lists are turned into one `DataFrame` at the end.
+    game_time_str_arr = []
+    t_secs_arr = []
+    quarter_seconds_remaining_arr = []
+    half_seconds_remaining_arr = []
+    game_seconds_remaining_arr = []
+    quarter_num_arr = []
+    event_team_arr = []
+    event_text_arr = []
+    is_overtime_arr = []
 
-    temp_df = pd.DataFrame()
     home_dir = expanduser("~")
     home_dir = _format_folder_str(home_dir)
 
@@ -2455,81 +2493,68 @@ def get_field_hockey_raw_pbp(game_id: int) -> pd.DataFrame:
 
     url = f"https://stats.ncaa.org/contests/{game_id}/play_by_play"
 
-    if exists(f"{home_dir}/.ncaa_stats_py/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/")
-
-    if exists(f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/"):
-        pass
-    else:
-        mkdir(f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/")
+    cache_dir = f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/"
+    cache_path = f"{cache_dir}{game_id}_raw_pbp.csv"
+    makedirs(cache_dir, exist_ok=True)
 
-    if exists(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/"
-        + f"{game_id}_raw_pbp.csv"
-    ):
-        games_df = pd.read_csv(
-            f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/"
-            + f"{game_id}_raw_pbp.csv"
-        )
-        games_df = games_df.infer_objects()
+    if exists(cache_path):
         file_mod_datetime = datetime.fromtimestamp(
-            getmtime(
-                f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/"
-                + f"{game_id}_raw_pbp.csv"
-            )
+            getmtime(cache_path), tz=_EASTERN_TZ
         )
-        load_from_cache = True
+        try:
+            cached_dates = pd.read_csv(
+                cache_path, usecols=["game_datetime"], nrows=1
+            )["game_datetime"].dropna()
+            load_from_cache = len(cached_dates) > 0
+        except (ValueError, pd.errors.EmptyDataError):
+            # A truncated (or hand-edited) cache file
+            # without a `game_datetime` column is downloaded again.
+            load_from_cache = False
     else:
-        file_mod_datetime = datetime.today()
         load_from_cache = False
 
-    now = datetime.today()
-
-    age = now - file_mod_datetime
-
-    if age.days >= 35:
-        load_from_cache = False
+    if load_from_cache is True:
+        # A PBP that was cached at least a day after the game started
+        # is treated as final, but is still re-downloaded after 35 days.
+        # That way, postponed, suspended or resumed games,
+        # and any later stat corrections, are eventually picked up.
+        # Anything cached before that is only kept for a day.
+        cached_game_datetime = datetime.fromisoformat(cached_dates.iloc[0])
+        is_final = (
+            file_mod_datetime - cached_game_datetime
+        ) >= timedelta(days=1)
+        age = datetime.now(tz=_EASTERN_TZ) - file_mod_datetime
+
+        if age.days >= 35:
+            load_from_cache = False
+        elif is_final is False and age.days >= 1:
+            load_from_cache = False
+        del cached_game_datetime, is_final, age
 
     if load_from_cache is True:
+        # Only read in the cached file once it's known to be fresh.
+        games_df = pd.read_csv(cache_path)
         return games_df
 
-    response = _get_webpage(url=url)
-    soup = BeautifulSoup(response.text, features="lxml")
+    root = _get_lxml_root(url=url)
 
-    info_table = soup.find(
-        "td",
-        {
-            "style": "padding: 0px 30px 0px 30px",
-            "class": "d-none d-md-table-cell"
-        }
-    ).find(
-        "table",
-        {"style": "border-collapse: collapse"}
-    )
-
-    info_table_rows = info_table.find_all("tr")
-
-    game_date_str = info_table_rows[3].find("td").text
-    if "TBA" in game_date_str:
-        game_datetime = datetime.strptime(game_date_str, '%m/%d/%Y TBA')
-    elif "tba" in game_date_str:
-        game_datetime = datetime.strptime(game_date_str, '%m/%d/%Y tba')
-    elif "TBD" in game_date_str:
-        game_datetime = datetime.strptime(game_date_str, '%m/%d/%Y TBD')
-    elif "tbd" in game_date_str:
-        game_datetime = datetime.strptime(game_date_str, '%m/%d/%Y tbd')
+    info_table_rows = _PBP_INFO_ROWS(root)
+
+    game_date_str = info_table_rows[3].find(".//td").text_content()
+    game_date_lower = game_date_str.lower()
+    if "tba" in game_date_lower or "tbd" in game_date_lower:
+        # The start time is "TBA"/"TBD" (in whatever case the page uses),
+        # so that token is matched literally.
+        date_format = "%m/%d/%Y " + game_date_str.split()[-1]
     elif ":" not in game_date_str:
-        game_datetime = datetime.strptime(game_date_str, '%m/%d/%Y')
+        date_format = "%m/%d/%Y"
     else:
-        game_datetime = datetime.strptime(game_date_str, '%m/%d/%Y %I:%M %p')
-    game_datetime = game_datetime.astimezone(timezone("US/Eastern"))
+        date_format = "%m/%d/%Y %I:%M %p"
+    game_datetime = datetime.strptime(game_date_str, date_format)
+    # `astimezone()` would treat this naive datetime as being
+    # in the timezone of the computer running this code,
+    # instead of the timezone the game time is actually listed in.
+    game_datetime = _EASTERN_TZ.localize(game_datetime)
     game_date_str = game_datetime.isoformat()
 
     if game_datetime.year == 2021 and game_datetime.month < 8:
@@ -2537,75 +2562,55 @@ def get_field_hockey_raw_pbp(game_id: int) -> pd.DataFrame:
     else:
         season = game_datetime.year
 
+    if season >= 2019:
+        pbp_era = "quarters"
+    elif season == 2018:
+        pbp_era = "halves_2018"
+    else:
+        pbp_era = "halves"
+
     del game_datetime
 
-    stadium_str = info_table_rows[4].find("td").text
+    stadium_str = info_table_rows[4].find(".//td").text_content()
 
-    attendance_str = info_table_rows[5].find("td").text
-    attendance_int = re.findall(
-        r"([0-9\,]+)",
-        attendance_str
-    )[0]
-    attendance_int = attendance_int.replace(",", "")
-    attendance_int = int(attendance_int)
+    attendance_str = info_table_rows[5].find(".//td").text_content()
+    attendance_int = int(
+        _ATTENDANCE_RE.search(attendance_str).group(0).translate(
+            _COMMA_TABLE
+        )
+    )
 
     del attendance_str
-    team_cards = soup.find_all(
-        "td",
-        {
-            "valign": "center",
-            "class": "grey_text d-none d-sm-table-cell"
-        }
-    )
+    team_cards = _PBP_TEAM_CARDS(root)
 
-    away_url = team_cards[0].find_all("a")
-    away_url = away_url[0]
-    home_url = team_cards[1].find_all("a")
-    home_url = home_url[0]
+    away_url = team_cards[0].find(".//a")
+    home_url = team_cards[1].find(".//a")
 
-    away_team_name = away_url.text
-    home_team_name = home_url.text
+    away_team_name = away_url.text_content()
+    home_team_name = home_url.text_content()
 
     away_team_id = away_url.get("href")
     home_team_id = home_url.get("href")
 
-    away_team_id = away_team_id.replace("/teams", "")
-    away_team_id = away_team_id.replace("/team", "")
-    away_team_id = away_team_id.replace("/", "")
-    away_team_id = int(away_team_id)
+    away_team_id = int(_TEAM_ID_RE.search(away_team_id).group(1))
+    home_team_id = int(_TEAM_ID_RE.search(home_team_id).group(1))
 
-    home_team_id = home_team_id.replace("/teams", "")
-    home_team_id = home_team_id.replace("/team", "")
-    home_team_id = home_team_id.replace("/", "")
-    home_team_id = int(home_team_id)
-
-    section_cards = soup.find_all(
-        "div",
-        {"class": "row justify-content-md-center w-100"}
-    )
+    section_cards = _PBP_SECTION_CARDS(root)
 
     for card in section_cards:
         # top_bot = ""
         event_text = ""
-        half_str = card.find(
-            "div",
-            {"class": "card-header"}
-        ).text
-        quarter_num = re.findall(
-            r"([0-9]+)",
-            half_str
-        )
-
-        quarter_num = int(quarter_num[0])
+        half_str = _PBP_CARD_HEADER(card)[0].text_content()
+        quarter_num = int(_QUARTER_NUM_RE.search(half_str).group(0))
 
         if "ot" in half_str.lower():
             is_overtime = True
             quarter_num += 4
-        table_body = card.find("table").find("tbody").find_all("tr")
+        table_body = _PBP_CARD_ROWS(card)
 
         for row in table_body:
-            t_cells = row.find_all("td")
-            t_cells = [x.text.strip() for x in t_cells]
+            t_cells = _PBP_ROW_CELLS(row)
+            t_cells = [x.text_content().strip() for x in t_cells]
             game_time_str = t_cells[0]
 
             if len(t_cells[1]) > 0:
@@ -2632,317 +2637,182 @@ def get_field_hockey_raw_pbp(game_id: int) -> pd.DataFrame:
             elif t_cells[1].lower() == "timeout commercial":
                 pass
             else:
-                away_score, home_score = t_cells[2].split("-")
-
-            away_score = int(away_score)
-            home_score = int(home_score)
+                away_score, _, home_score = t_cells[2].partition("-")
+                away_score = int(away_score)
+                home_score = int(home_score)
 
-            try:
+            if ":" in game_time_str:
                 temp_time_minutes, temp_time_seconds = \
-                    game_time_str.split(":")
-            except ValueError as e:
+                    game_time_str.split(":", 1)
+                temp_time_minutes = int(temp_time_minutes)
+                temp_time_seconds = int(temp_time_seconds)
+                # game_time_ms = int(game_time_ms)
+                t_secs = (temp_time_minutes * 60) + temp_time_seconds
+            else:
+                # Rows without a game clock keep the game clock
+                # of the previous row (or 0, if this is the first row).
                 logging.info(
-                    f"Value error detected, full exception `{e}`"
-                )
-                # event_text = t_cells[0]
-                # temp_time_minutes = 0
-                # temp_time_seconds = 0
-            except Exception as e:
-                raise Exception(
-                    f"Unhandled exception `{e}`"
+                    f"Could not parse a game clock from `{game_time_str}`."
                 )
 
-            temp_time_minutes = int(temp_time_minutes)
-            temp_time_seconds = int(temp_time_seconds)
-            # game_time_ms = int(game_time_ms)
-            # game_time_seconds = temp_time_seconds + (temp_time_minutes * 60)
+            # The number of seconds remaining in the quarter, half,
+            # and game are calculated for every event at once,
+            # after all quarters have been parsed.
+            game_time_str_arr.append(game_time_str)
+            t_secs_arr.append(t_secs)
+            quarter_seconds_remaining_arr.append(None)
+            half_seconds_remaining_arr.append(None)
+            game_seconds_remaining_arr.append(None)
+            quarter_num_arr.append(quarter_num)
+            event_team_arr.append(event_team)
+            event_text_arr.append(event_text)
+            is_overtime_arr.append(is_overtime)
+
+        (
+            end_time_str,
+            half_seconds_remaining,
+            game_seconds_remaining
+        ) = _PBP_PERIOD_END_TABLE.get(
+            (pbp_era, quarter_num),
+            _PBP_PERIOD_END_TABLE[(pbp_era, 0)]
+        )
+        if end_time_str is not None:
+            game_time_str = end_time_str
+
+        game_time_str_arr.append(game_time_str)
+        t_secs_arr.append(None)
+        quarter_seconds_remaining_arr.append(0)
+        half_seconds_remaining_arr.append(half_seconds_remaining)
+        game_seconds_remaining_arr.append(game_seconds_remaining)
+        quarter_num_arr.append(quarter_num)
+        event_team_arr.append(event_team)
+        event_text_arr.append("End of Quarter")
+        is_overtime_arr.append(is_overtime)
+
+    # "End of Quarter" rows already have these values set,
+    # and do not have a `t_secs` value.
+    is_event = np.array(
+        [t is not None for t in t_secs_arr], dtype=bool
+    )
+    t_secs_arr = np.array(
+        [0 if t is None else t for t in t_secs_arr], dtype=np.int64
+    )
+    quarter_num_arr = np.array(quarter_num_arr, dtype=np.int64)
+    quarter_idx = np.clip(quarter_num_arr, 1, 6)
+    seconds_remaining = (
+        _PBP_TIME_TABLE[pbp_era][quarter_idx] - t_secs_arr[:, np.newaxis]
+    )
+
+    seconds_remaining_cols = []
+    for i, col_arr in enumerate(
+        [
+            quarter_seconds_remaining_arr,
+            half_seconds_remaining_arr,
+            game_seconds_remaining_arr,
+        ]
+    ):
+        seconds_remaining_cols.append(
+            np.where(
+                is_event,
+                seconds_remaining[:, i],
+                np.array(
+                    [0 if x is None else x for x in col_arr],
+                    dtype=np.int64
+                ),
+            )
+        )
 
-            if (
-                "end of" in t_cells[1].lower() and
-                "quarter" in t_cells[1].lower()
-            ):
-                quarter_seconds_remaining = (
-                    3600 - (900 * quarter_num)
-                )
-                half_seconds_remaining = (
-                    3600 - (900 * quarter_num)
-                )
-                game_seconds_remaining = (
-                    3600 - (900 * quarter_num)
-                )
-            if season >= 2019:
-                # In 2019, to conform to a major
-                # International Hockey Federation (IHF) rule change going from
-                # two 35 minute halves to four 15 minute quarters.
-                # https://ncaaorg.s3.amazonaws.com/championships/sports/fieldhockey/rules/2019-20PRWFH_MajorRulesModifications.pdf
-                if quarter_num == 1:
-                    quarter_seconds_remaining = (
-                        (900 * 1) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (900 * 2) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif quarter_num == 2:
-                    quarter_seconds_remaining = (
-                        (900 * 2) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (900 * 2) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif quarter_num == 3:
-                    quarter_seconds_remaining = (
-                        (900 * 3) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif quarter_num == 4:
-                    quarter_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (900 * 4) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif quarter_num == 5:
-                    # Starting in 2018, Field hockey overtimes
-                    # were reduced from 15 minute periods,
-                    # to 10 minute periods.
-                    # https://www.ncaa.com/news/fieldhockey/article/2018-06-13/overtime-length-reduced-two-10-minute-periods-ncaa-field-hockey
-                    quarter_seconds_remaining = (
-                        (900 * 4) + 600 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (900 * 4) + 1200 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (900 * 4) + 1200 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif quarter_num == 6:
-                    quarter_seconds_remaining = (
-                        (900 * 4) + 1200 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (900 * 4) + 1200 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (900 * 4) + 1200 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-            elif season <= 2018:
-                if quarter_num == 1:
-                    quarter_seconds_remaining = (
-                        (35 * 60) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = quarter_seconds_remaining
-                    game_seconds_remaining = (
-                        (70 * 60) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif quarter_num == 2:
-                    quarter_seconds_remaining = (
-                        (70 * 60) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = quarter_seconds_remaining
-                    game_seconds_remaining = (
-                        (70 * 60) -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                elif season == 2018:
-                    # Specifically in 2018, before the move to quarters,
-                    # field hockey overtimes
-                    # were reduced from 15 minute periods,
-                    # to 10 minute periods.
-                    # https://www.ncaa.com/news/fieldhockey/article/2018-06-13/overtime-length-reduced-two-10-minute-periods-ncaa-field-hockey
-
-                    quarter_seconds_remaining = (
-                        (70 * 60) + 600 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (70 * 60) + 600 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (70 * 60) + 600 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
+    # Built directly in the order of `stat_columns`,
+    # so the columns do not need to be reordered afterwards.
+    pbp_df = pd.DataFrame(
+        {
+            "season": season,
+            "sport_id": sport_id,
+            "game_id": game_id,
+            "game_time_str": game_time_str_arr,
+            "quarter_seconds_remaining": seconds_remaining_cols[0],
+            "half_seconds_remaining": seconds_remaining_cols[1],
+            "game_seconds_remaining": seconds_remaining_cols[2],
+            "quarter_num": quarter_num_arr,
+            "event_team": event_team_arr,
+            "event_text": event_text_arr,
+            "is_overtime": np.array(is_overtime_arr, dtype=bool),
+            "event_num": np.arange(
+                1, len(game_time_str_arr) + 1, dtype=np.int64
+            ),
+            "game_datetime": game_date_str,
+            "stadium_name": stadium_str,
+            "attendance": attendance_int,
+            "away_team_id": away_team_id,
+            "away_team_name": away_team_name,
+            "home_team_id": home_team_id,
+            "home_team_name": home_team_name,
+        },
+        columns=stat_columns,
+    )
 
-                    if quarter_num == 5:
-                        half_seconds_remaining += 600
-                        game_seconds_remaining += 600
-                else:
-                    # Specifically in 2018, before the move to quarters,
-                    # field hockey overtimes
-                    # were reduced from 15 minute periods,
-                    # to 10 minute periods.
-                    # https://www.ncaa.com/news/fieldhockey/article/2018-06-13/overtime-length-reduced-two-10-minute-periods-ncaa-field-hockey
-
-                    quarter_seconds_remaining = (
-                        (70 * 60) + 900 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    half_seconds_remaining = (
-                        (70 * 60) + 900 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
-                    game_seconds_remaining = (
-                        (70 * 60) + 900 -
-                        ((temp_time_minutes * 60) + temp_time_seconds)
-                    )
+    pbp_df.to_csv(cache_path, index=False)
+    return pbp_df
 
-                    if quarter_num >= 3:
-                        half_seconds_remaining += 900
-                        game_seconds_remaining += 900
 
-                    if quarter_num == 4:
-                        quarter_seconds_remaining += 900
+def get_field_hockey_raw_pbp_batch(
+    game_ids: list[int],
+    max_workers: int = 4
+) -> pd.DataFrame:
+    """
+    Given a list of valid game IDs,
+    this function will attempt to get the raw play-by-play (PBP)
+    data for all of those games,
+    by calling `get_field_hockey_raw_pbp()` for several games at a time.
 
-            temp_df = pd.DataFrame(
-                {
-                    # "season": season,
-                    # "game_id": game_id,
-                    # "sport_id": sport_id,
-                    # "away_team_id": away_team_id,
-                    # "away_team_name": away_team_name,
-                    # "home_team_id": home_team_id,
-                    # "home_team_name": home_team_name,
-                    "game_time_str": game_time_str,
-                    "quarter_seconds_remaining": quarter_seconds_remaining,
-                    "half_seconds_remaining": half_seconds_remaining,
-                    "game_seconds_remaining": game_seconds_remaining,
-                    "quarter_num": quarter_num,
-                    "event_team": event_team,
-                    "event_text": event_text,
-                    "is_overtime": is_overtime
-                },
-                index=[0],
-            )
-            pbp_df_arr.append(temp_df)
-
-        if season >= 2019:
-            # In 2019, to conform to a major
-            # International Hockey Federation (IHF) rule change going from
-            # two 35 minute halves to four 15 minute quarters.
-            # https://ncaaorg.s3.amazonaws.com/championships/sports/fieldhockey/rules/2019-20PRWFH_MajorRulesModifications.pdf
-            if quarter_num == 1:
-                game_time_str = "15:00"
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 900
-                game_seconds_remaining = (900 * 3)
-            elif quarter_num == 2:
-                game_time_str = "30:00"
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 0
-                game_seconds_remaining = (900 * 2)
-            elif quarter_num == 3:
-                game_time_str = "45:00"
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 900
-                game_seconds_remaining = (900 * 1)
-            elif quarter_num == 4:
-                game_time_str = "60:00"
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 0
-                game_seconds_remaining = 0
-            else:
-                # Starting in 2018, Field hockey overtimes
-                # were reduced from 15 minute periods,
-                # to 10 minute periods.
-                # https://www.ncaa.com/news/fieldhockey/article/2018-06-13/overtime-length-reduced-two-10-minute-periods-ncaa-field-hockey
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 0
-                game_seconds_remaining = 0
-        elif season <= 2018:
-            if quarter_num == 1:
-                game_time_str = "35:00"
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = quarter_seconds_remaining
-                game_seconds_remaining = (35 * 60)
-            elif quarter_num == 2:
-                game_time_str = "70:00"
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = quarter_seconds_remaining
-                game_seconds_remaining = 0
-            elif season == 2018:
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 600
-                game_seconds_remaining = 600
-            else:
-                quarter_seconds_remaining = 0
-                half_seconds_remaining = 0
-                game_seconds_remaining = 0
+    Parameters
+    ----------
+    `game_ids` (list[int], mandatory):
+        Required argument.
+        Specifies the games you want play-by-play data (PBP) from.
 
-        temp_df = pd.DataFrame(
-            {
-                # "season": season,
-                # "game_id": game_id,
-                # "sport_id": sport_id,
-                # "away_team_id": away_team_id,
-                # "away_team_name": away_team_name,
-                # "home_team_id": home_team_id,
-                # "home_team_name": home_team_name,
-                "game_time_str": game_time_str,
-                "quarter_seconds_remaining": 0,
-                "half_seconds_remaining": half_seconds_remaining,
-                "game_seconds_remaining": game_seconds_remaining,
-                "quarter_num": quarter_num,
-                "event_team": event_team,
-                "event_text": "End of Quarter",
-                "is_overtime": is_overtime
-            },
-            index=[0],
-        )
-        pbp_df_arr.append(temp_df)
+    `max_workers` (int, optional):
+        Optional argument.
+        Specifies the maximum number of games that will be processed
+        at the same time.
+        Requests to stats.ncaa.org are still sent one at a time,
+        with the same 5-10 second wait between them
+        as a loop of `get_field_hockey_raw_pbp()` calls.
+        Extra workers only overlap that wait
+        with parsing and caching the games already downloaded.
 
-    pbp_df = pd.concat(pbp_df_arr, ignore_index=True)
-    pbp_df["event_num"] = pbp_df.index + 1
-    pbp_df["game_datetime"] = game_date_str
-    pbp_df["season"] = season
-    pbp_df["game_id"] = game_id
-    pbp_df["sport_id"] = sport_id
-    pbp_df["stadium_name"] = stadium_str
-    pbp_df["attendance"] = attendance_int
-    pbp_df["away_team_id"] = away_team_id
-    pbp_df["away_team_name"] = away_team_name
-    pbp_df["home_team_id"] = home_team_id
-    pbp_df["home_team_name"] = home_team_name
-
-    pbp_df = pbp_df.reindex(columns=stat_columns)
-    pbp_df = pbp_df.infer_objects()
-    pbp_df.to_csv(
-        f"{home_dir}/.ncaa_stats_py/field_hockey/raw_pbp/"
-        + f"{game_id}_raw_pbp.csv",
-        index=False
+    Usage
+    ----------
+    ```python
+
+    from ncaa_stats_py.field_hockey import get_field_hockey_raw_pbp_batch
+
+
+    # Get the play-by-play data of the
+    # 2024 NCAA D1 Field Hockey National Championship game,
+    # and a September 22nd, 2024 game between
+    # the Saint Joseph's Hawks and the Duke Blue Devils.
+    print(
+        "Get the play-by-play data of the "
+        + "2024 NCAA D1 Field Hockey National Championship game, "
+        + "and a September 22nd, 2024 game between "
+        + "the Saint Joseph's Hawks and the Duke Blue Devils."
     )
+    df = get_field_hockey_raw_pbp_batch([5835105, 5685953])
+    print(df)
+
+    ```
+    Returns
+    ----------
+    A pandas `DataFrame` object with a play-by-play (PBP) data
+    for every game in `game_ids`, in the same order as `game_ids`.
+
+    """
+    if len(game_ids) == 0:
+        return pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pbp_df_arr = list(executor.map(get_field_hockey_raw_pbp, game_ids))
+
+    pbp_df = pd.concat(pbp_df_arr, ignore_index=True)
     return pbp_df
@@ -12,11 +12,14 @@
 # - 2024-12-17 10:30 AM EDT
 # - 2025-01-04 03:00 PM EDT
 # - 2025-01-18 02:40 PM EDT
+# - 2026-10-17 10:00 AM EDT
 
 
 import logging
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from os import mkdir
 from os.path import exists, expanduser, getmtime
 from secrets import SystemRandom
@@ -24,6 +27,9 @@ from secrets import SystemRandom
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from lxml import html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 def _stat_id_dict() -> dict:
@@ -653,13 +659,45 @@ def _web_headers() -> dict:
     return headers
 
 
+# One session for the whole package, so that repeated calls to
+# `stats.ncaa.org` reuse pooled keep-alive connections
+# instead of paying for a new TCP/TLS handshake on every request.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+# The headers are set once on the session,
+# instead of being rebuilt and merged on every request.
+_SESSION.headers.update(_web_headers())
+
+# Every thread in this process waits on the same lock
+# before sending a request to `stats.ncaa.org`,
+# and the time of the last request is shared between them.
+# This keeps the 5-10 second wait between requests,
+# even when several functions are called from a thread pool.
+_WEBPAGE_LOCK = threading.Lock()
+_last_request_time = 0.0
+
+
 def _get_webpage(url: str) -> requests.Response:
     """ """
+    global _last_request_time
+
     rng = SystemRandom()
-    headers = _web_headers()
-    response = requests.get(headers=headers, url=url, timeout=30)
-    random_integer = 5 + rng.randint(a=0, b=5)
-    time.sleep(random_integer)
+    with _WEBPAGE_LOCK:
+        random_integer = 5 + rng.randint(a=0, b=5)
+        time_since_request = time.monotonic() - _last_request_time
+        if time_since_request < random_integer:
+            time.sleep(random_integer - time_since_request)
+        try:
+            response = _SESSION.get(url=url, timeout=30)
+        finally:
+            _last_request_time = time.monotonic()
     if response.status_code == 200:
         return response
     elif response.status_code == 400:
@@ -752,18 +790,42 @@ def _get_webpage(url: str) -> requests.Response:
         )
 
 
+def _get_lxml_root(url: str) -> html.HtmlElement:
+    """
+    Downloads a webpage (through `_get_webpage()`),
+    and returns the root element of that page,
+    as parsed by `lxml.html`.
+    """
+    response = _get_webpage(url=url)
+    # Parsing the raw bytes avoids building a decoded copy of the page
+    # (`response.text`) that's thrown away right after parsing.
+    # The encoding `requests` would have used to decode the page
+    # is passed along, so the page is read the same way.
+    # A new parser is made for every call,
+    # because an lxml parser can't be shared between threads.
+    parser = html.HTMLParser(
+        encoding=response.encoding or response.apparent_encoding
+    )
+    return html.fromstring(response.content, parser=parser)
+
+
 def _format_folder_str(folder_str: str) -> str:
     folder_str = folder_str.replace("\\", "/")
     folder_str = folder_str.replace("//", "/")
     return folder_str
 
 
-def _get_schools() -> pd.DataFrame:
-    """ """
+@lru_cache(maxsize=1)
+def _load_schools() -> pd.DataFrame:
+    """
+    Does the actual work for `_get_schools()`.
+
+    Cached for the life of this process, since every sport's
+    team and schedule functions call `_get_schools()`.
+    """
     load_from_cache = True
     schools_df = pd.DataFrame()
     schools_df_arr = []
-    temp_df = pd.DataFrame()
 
     home_dir = expanduser("~")
     home_dir = _format_folder_str(home_dir)
@@ -817,14 +879,11 @@ def _get_schools() -> pd.DataFrame:
             else:
                 school_id = int(school_id)
 
-                temp_df = pd.DataFrame(
-                    {"school_id": school_id, "school_name": school_name},
-                    index=[0]
+                schools_df_arr.append(
+                    {"school_id": school_id, "school_name": school_name}
                 )
-                schools_df_arr.append(temp_df)
-                del temp_df
 
-    schools_df = pd.concat(schools_df_arr, ignore_index=True)
+    schools_df = pd.DataFrame.from_records(schools_df_arr)
     schools_df.sort_values(by=["school_id"], inplace=True)
     schools_df.drop_duplicates(subset=["school_name"], inplace=True)
     schools_df.to_csv(f"{home_dir}/.ncaa_stats_py/schools.csv", index=False)
@@ -832,6 +891,13 @@ def _get_schools() -> pd.DataFrame:
     return schools_df
 
 
+def _get_schools() -> pd.DataFrame:
+    """ """
+    # `_load_schools()` is cached for the life of this process,
+    # so a copy is returned to keep callers from modifying the cached copy.
+    return _load_schools().copy()
+
+
 def _get_stat_id(sport: str, season: int, stat_type: str) -> int:
     """ """
     data = _stat_id_dict()